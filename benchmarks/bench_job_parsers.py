@@ -0,0 +1,59 @@
+"""
+Job Card Parser Benchmark
+Compares the job_parsers backends on saved Indeed results pages
+
+Usage:
+    python benchmarks/bench_job_parsers.py [--repeat N] [fixture.html ...]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from job_parsers import PARSERS
+
+FIXTURE_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job card parser backends")
+    parser.add_argument('fixtures', nargs='*', help="Saved results pages (default: benchmarks/fixtures/indeed_page_*.html)")
+    parser.add_argument('--repeat', type=int, default=20, help="Parses per backend per page")
+    args = parser.parse_args()
+    
+    paths = args.fixtures or sorted(glob.glob(os.path.join(FIXTURE_DIR, 'indeed_page_*.html')))
+    if not paths:
+        sys.exit("No fixture pages found")
+    pages = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            pages.append((os.path.basename(path), f.read()))
+    
+    # Every backend must agree with the reference parser before it is timed
+    for name, content in pages:
+        expected = PARSERS['soup'](content)
+        for backend, parse in PARSERS.items():
+            if parse(content) != expected:
+                sys.exit(f"{backend} output differs from soup on {name}")
+    
+    print(f"{len(pages)} page(s), {args.repeat} parses each")
+    print(f"{'backend':<10} {'ms/page':>10} {'speedup':>8}")
+    
+    baseline = None
+    for backend, parse in PARSERS.items():
+        seconds = timeit.timeit(
+            lambda: [parse(content) for _, content in pages], number=args.repeat
+        )
+        per_page_ms = seconds / (args.repeat * len(pages)) * 1000
+        if baseline is None:
+            baseline = per_page_ms
+        print(f"{backend:<10} {per_page_ms:>10.2f} {baseline / per_page_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Pipeline Benchmark
+Runs the full SignalPipeline offline against synthetic load: Indeed pages and
+publisher feeds come from a local stand-in server, Reddit from a fake client.
+Reports throughput and memory growth per stage
+
+Usage:
+    python benchmarks/bench_pipeline.py [--jobs N] [--posts N] [--companies N] [--page-size N]
+                                        [--rss-items N] [--workers N] [--seed N] [--report path.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import config
+import sharded_crawl
+from conversation_tracker import ConversationTracker
+from data_processor import DataProcessor
+from entity_resolution import CompanyResolver
+from hiring_tracker import HiringTracker
+from instrumentation import metrics
+from load_generator import SUBREDDITS, FakeReddit, LoadGenerator, StubServer
+from pipeline import SignalPipeline
+from rate_limiter import rate_limiter
+from signal_store import SignalStore
+
+
+SOURCE_COUNTERS = ['items.indeed', 'items.linkedin', 'items.reddit', 'items.rss']
+
+
+def stage_items(counters):
+    """Items each stage handled, for throughput"""
+    return {
+        'collect': sum(counters.get(name, 0) for name in SOURCE_COUNTERS),
+        'dedupe': counters.get('dedupe.companies', 0),
+        'enrich': counters.get('enrich.companies', 0),
+        'rank': counters.get('rank.records', 0),
+        'export': sum(value for name, value in counters.items() if name.startswith('export.rows.'))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the signal pipeline on synthetic load")
+    parser.add_argument('--jobs', type=int, default=10_000, help="Job postings served across all hiring keywords")
+    parser.add_argument('--posts', type=int, default=10_000, help="Reddit posts served across all searches")
+    parser.add_argument('--companies', type=int, default=2_000, help="Distinct companies postings are drawn from")
+    parser.add_argument('--page-size', type=int, default=50, help="Job cards per Indeed page")
+    parser.add_argument('--rss-items', type=int, default=20, help="Items per publisher feed")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes (sharded crawl when > 1)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--report', help="Also write the full run report to this JSON file")
+    args = parser.parse_args()
+    
+    hiring_keywords = sum(len(keywords) for keywords in config.HIRING_KEYWORDS.values())
+    topic_keywords = sum(len(keywords) for keywords in config.CONVERSATION_TOPICS.values())
+    generator = LoadGenerator(
+        seed=args.seed,
+        companies=args.companies,
+        jobs_per_keyword=math.ceil(args.jobs / hiring_keywords),
+        posts_per_search=math.ceil(args.posts / (topic_keywords * len(SUBREDDITS))),
+        rss_items=args.rss_items,
+        page_size=args.page_size
+    )
+    
+    workdir = tempfile.mkdtemp(prefix='bench_pipeline_')
+    os.chdir(workdir)  # Store, HTTP cache and outputs all land here
+    
+    with StubServer(generator) as server:
+        # Point every source at the stand-in server and lift the politeness limits
+        config.JOB_BOARDS['indeed'].update({
+            'base_url': f"{server.url}/jobs",
+            'max_results': generator.jobs_per_keyword,
+            'page_size': args.page_size
+        })
+        for i, publisher in enumerate(config.CYBERSECURITY_PUBLISHERS):
+            publisher['rss'] = f"{server.url}/rss/{i}"
+        config.COLLECTION_SETTINGS['default_host_concurrency'] = 8
+        rate_limiter.limits['default'] = {'requests': 1_000_000, 'per_seconds': 1}
+        rate_limiter.limits['oauth.reddit.com'] = {'requests': 1_000_000, 'per_seconds': 1}
+        
+        def make_conversation_tracker():
+            tracker = ConversationTracker()
+            tracker.reddit = FakeReddit(generator)
+            return tracker
+        
+        # Sharded workers build their own trackers (they inherit this patch when forked)
+        sharded_crawl.ConversationTracker = make_conversation_tracker
+        conversation_tracker = make_conversation_tracker()
+        pipeline = SignalPipeline(
+            hiring_tracker=HiringTracker(),
+            conversation_tracker=conversation_tracker,
+            data_processor=DataProcessor(resolver=CompanyResolver()),
+            store=SignalStore(os.path.join(workdir, 'signals.db')),
+            output_dir=os.path.join(workdir, 'outputs'),
+            workers=args.workers
+        )
+        
+        print(f"jobs: {args.jobs:,}  posts: {args.posts:,}  companies: {args.companies:,}  "
+              f"workers: {args.workers}  workdir: {workdir}")
+        sys.stdout.flush()
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')  # Trackers print per query
+        try:
+            pipeline.run()
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+    
+    report = metrics.report()
+    items = stage_items(report['counters'])
+    
+    print(f"{'stage':<8} {'seconds':>9} {'items':>10} {'items/s':>12} {'RSS +MB':>9} {'peak RSS MB':>12}")
+    for name, stage in report['stages'].items():
+        rate = items[name] / stage['seconds'] if stage['seconds'] else 0
+        print(f"{name:<8} {stage['seconds']:>9.3f} {items[name]:>10,} {rate:>12,.0f} "
+              f"{stage['rss_delta_mb']!s:>9} {stage['process_peak_rss_mb']:>12}")
+    
+    counters = report['counters']
+    print(f"\nHTTP requests: {counters.get('http.requests', 0):,}  "
+          f"connections opened: {counters.get('http.connections.opened', 0):,}  "
+          f"bytes: {counters.get('http.bytes', 0) / 1e6:,.1f} MB  "
+          f"on the wire: {counters.get('http.wire_bytes', 0) / 1e6:,.1f} MB")
+    print(f"companies: {len(pipeline.companies):,}  people: {len(pipeline.people):,}  "
+          f"publishers: {len(pipeline.publishers):,}")
+    
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
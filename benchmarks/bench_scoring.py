@@ -0,0 +1,129 @@
+"""
+Scoring Benchmark
+Per-row cost of bucketing company and people records the way the pipeline
+does (DataProcessor.enrich_companies and the scoring.py buckets applied at
+rank time) vs a columnar round trip: records -> pandas frame -> pd.cut ->
+labels copied back onto the records
+
+Usage:
+    python benchmarks/bench_scoring.py [--rows N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_processor import DataProcessor
+from entity_resolution import CompanyResolver
+from records import Company, Person
+from scoring import influence_score, signal_strength
+
+INF = float('inf')
+
+
+def report(label, seconds, rows):
+    print(f"{label:<36} {seconds:>8.3f}s {seconds / rows * 1e9:>10.1f} ns/row")
+
+
+def make_records(rows):
+    """rows companies and people with the value spread of a weekly run"""
+    random.seed(42)
+    # Small shared sets: only their sizes feed the scores
+    category_sets = [frozenset(range(n)) for n in range(1, 6)]
+    source_sets = [frozenset(range(n)) for n in range(1, 3)]
+    
+    companies = []
+    people = []
+    for i in range(rows):
+        company = Company(f"company {i}")
+        company.total_jobs = random.randint(1, 59)
+        company.categories = random.choice(category_sets)
+        company.sources = random.choice(source_sets)
+        companies.append(company)
+        
+        person = Person(f"user {i}", 'Reddit')
+        person.engagement = random.randint(0, 4999)
+        people.append(person)
+    return companies, people
+
+
+def columnar_companies(companies):
+    """The columnar alternative: frame from the records, pd.cut, labels set back"""
+    import numpy as np
+    import pandas as pd
+    
+    total_jobs = np.fromiter((company.total_jobs for company in companies), dtype=np.int64)
+    score = (
+        total_jobs * 10
+        + np.fromiter((len(company.categories) for company in companies), dtype=np.int64) * 5
+        + np.fromiter((len(company.sources) for company in companies), dtype=np.int64) * 3
+    )
+    frame = pd.DataFrame({'total_jobs': total_jobs, 'signal_score': score})
+    columns = {
+        'signal_strength': pd.cut(frame['signal_score'], [-INF, 20, 50, 100, INF], right=False,
+                                  labels=["Low", "Medium", "High", "Very High"]),
+        'estimated_size': pd.cut(frame['total_jobs'], [-INF, 10, 20, INF], right=False,
+                                 labels=["Small", "Medium", "Large"]),
+        'hiring_intensity': pd.cut(frame['total_jobs'], [-INF, 3, 8, 15, INF], right=False,
+                                   labels=["Low", "Moderate", "Active", "Very Active"])
+    }
+    for column, values in columns.items():
+        for company, value in zip(companies, values.tolist()):
+            setattr(company, column, value)
+
+
+def columnar_people(people):
+    import numpy as np
+    import pandas as pd
+    
+    engagement = np.fromiter((person.engagement for person in people), dtype=np.int64)
+    values = pd.cut(engagement, [-INF, 100, 500, 1000, INF], right=False,
+                    labels=["Low", "Medium", "High", "Very High"])
+    for person, value in zip(people, values.tolist()):
+        person.influence_score = value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark company/people scoring")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Company and people records")
+    args = parser.parse_args()
+    
+    companies, people = make_records(args.rows)
+    processor = DataProcessor(resolver=CompanyResolver())
+    print(f"rows: {args.rows:,}")
+    
+    start = time.perf_counter()
+    processor.enrich_companies(companies)
+    for company in companies:
+        company.signal_strength = signal_strength(company)
+    report("companies: per record (pipeline)", time.perf_counter() - start, args.rows)
+    expected = [(c.signal_strength, c.estimated_size, c.hiring_intensity) for c in companies]
+    
+    start = time.perf_counter()
+    import pandas  # noqa: F401 - paid once by the first columnar call
+    print(f"{'pandas import':<36} {time.perf_counter() - start:>8.3f}s")
+    
+    start = time.perf_counter()
+    columnar_companies(companies)
+    report("companies: columnar round trip", time.perf_counter() - start, args.rows)
+    assert expected == [(c.signal_strength, c.estimated_size, c.hiring_intensity) for c in companies]
+    
+    start = time.perf_counter()
+    for person in people:
+        person.influence_score = influence_score(person)
+    report("people: per record (pipeline)", time.perf_counter() - start, args.rows)
+    expected = [person.influence_score for person in people]
+    
+    start = time.perf_counter()
+    columnar_people(people)
+    report("people: columnar round trip", time.perf_counter() - start, args.rows)
+    assert expected == [person.influence_score for person in people]
+
+
+if __name__ == "__main__":
+    main()
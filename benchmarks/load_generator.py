@@ -0,0 +1,229 @@
+"""
+Synthetic Load Generator
+Seeded raw source payloads for offline benchmarks: Indeed results pages,
+publisher RSS feeds and Reddit-like submissions, plus a local HTTP server
+that stands in for Indeed and the publisher feeds
+
+Every payload is a pure function of the seed and the request, so runs are
+repeatable and no payload has to be held in memory ahead of time.
+"""
+
+import gzip
+import hashlib
+import os
+import random
+import re
+import sys
+import threading
+import time
+from email.utils import formatdate
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import CONVERSATION_TOPICS
+from generate_sample_data import SAMPLE_COMPANIES, SAMPLE_POSTS, SAMPLE_ROLES, SAMPLE_USERNAMES
+
+COMPANY_SUFFIXES = ['', '', '', '', ' Inc', ' Inc.', ', Inc.', ' LLC', ' Corp', ' Ltd', ' GmbH']
+# Titles the role classifier should drop
+OFF_TOPIC_ROLES = ["Account Executive", "Marketing Manager", "Office Coordinator", "Data Analyst"]
+LOCATIONS = [
+    "New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA", "Boston, MA",
+    "Chicago, IL", "Denver, CO", "Atlanta, GA", "Remote", "Washington, DC"
+]
+SUBREDDITS = ['cybersecurity', 'netsec', 'sysadmin', 'security', 'SaaS']
+TOPIC_KEYWORDS = [keyword for keywords in CONVERSATION_TOPICS.values() for keyword in keywords]
+
+CARD = (
+    '<div class="job_seen_beacon"><table class="jobCard_mainContent"><tbody><tr><td class="resultContent">'
+    '<div><h2 class="jobTitle css-198pbd"><a data-jk="{jk}" class="jcs-JobTitle" href="/rc/clk?jk={jk}&amp;fccid=0f0">'
+    '<span title="{title}">{title}</span></a></h2></div>'
+    '<div class="company_location"><div><span class="companyName">{company}</span>'
+    '<div class="companyLocation">{location}</div></div></div>'
+    '<div class="metadata"><div class="css-1cvo3fd">Full-time</div></div>'
+    '</td></tr></tbody></table></div>'
+)
+RSS_ITEM = (
+    '<item><title>{title}</title><link>{link}</link><pubDate>{published}</pubDate>'
+    '<description>{summary}</description></item>'
+)
+
+
+class LoadGenerator:
+    """
+    Deterministic source payloads at configurable scale.
+    
+    companies sets how many distinct companies postings are drawn from
+    (each shown with random legal-suffix variants, so dedupe has work to
+    do); jobs_per_keyword, posts_per_search and rss_items size each source.
+    """
+    
+    def __init__(self, seed=42, companies=2000, jobs_per_keyword=500, posts_per_search=100,
+                 rss_items=20, page_size=10, now=None):
+        self.seed = seed
+        self.jobs_per_keyword = jobs_per_keyword
+        self.posts_per_search = posts_per_search
+        self.rss_items = rss_items
+        self.page_size = page_size
+        self.now = now or time.time()
+        
+        rng = random.Random(seed)
+        names = list(dict.fromkeys(SAMPLE_COMPANIES))
+        while len(names) < companies:
+            names.append(f"{rng.choice(SAMPLE_COMPANIES)} {rng.choice(['Labs', 'Cloud', 'Systems', 'AI'])} {len(names)}")
+        self.companies = names[:companies]
+        self.usernames = SAMPLE_USERNAMES + [f"user_{i}" for i in range(max(0, companies - len(SAMPLE_USERNAMES)))]
+    
+    def _rng(self, *parts):
+        return random.Random('|'.join(str(part) for part in (self.seed,) + parts))
+    
+    def job_card(self, keyword, index):
+        rng = self._rng('job', keyword, index)
+        roles = OFF_TOPIC_ROLES if rng.random() < 0.1 else SAMPLE_ROLES
+        return {
+            'jk': hashlib.sha1(f"{self.seed}|{keyword}|{index}".encode()).hexdigest()[:16],
+            'title': rng.choice(roles),
+            'company': rng.choice(self.companies) + rng.choice(COMPANY_SUFFIXES),
+            'location': rng.choice(LOCATIONS)
+        }
+    
+    def indeed_page(self, keyword, start):
+        """One results page; past the end the last page is served again, like Indeed"""
+        if start >= self.jobs_per_keyword:
+            start = max(0, self.jobs_per_keyword - self.page_size)
+        end = min(start + self.page_size, self.jobs_per_keyword)
+        cards = ''.join(
+            CARD.format(**{key: escape(value) for key, value in self.job_card(keyword, index).items()})
+            for index in range(start, end)
+        )
+        return (
+            f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+            f'<title>{escape(keyword)} Jobs | Indeed.com</title></head><body>'
+            f'<div id="mosaic-provider-jobcards"><ul class="jobsearch-ResultsList">{cards}</ul></div>'
+            f'</body></html>'
+        ).encode('utf-8')
+    
+    def rss_feed(self, feed_id):
+        """RSS 2.0 feed; about a third of the items mention a conversation topic"""
+        rng = self._rng('rss', feed_id)
+        items = []
+        for i in range(self.rss_items):
+            topic = rng.choice(TOPIC_KEYWORDS) if rng.random() < 0.35 else None
+            title = rng.choice(SAMPLE_POSTS) + (f": {topic}" if topic else '')
+            items.append(RSS_ITEM.format(
+                title=escape(title),
+                link=f"https://publisher-{feed_id}.example.com/articles/{i}",
+                published=formatdate(self.now - rng.uniform(0, 7 * 86400), usegmt=True),
+                summary=escape(f"{rng.choice(SAMPLE_POSTS)}. " * 4)
+            ))
+        return (
+            f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+            f'<title>Publisher {feed_id}</title><link>https://publisher-{feed_id}.example.com</link>'
+            f'{"".join(items)}</channel></rss>'
+        ).encode('utf-8')
+    
+    def reddit_posts(self, subreddit, keyword):
+        """Submission-like objects with the attributes search_reddit reads"""
+        rng = self._rng('reddit', subreddit, keyword)
+        for i in range(self.posts_per_search):
+            post_id = hashlib.sha1(f"{self.seed}|{subreddit}|{keyword}|{i}".encode()).hexdigest()[:8]
+            yield SimpleNamespace(
+                author=rng.choice(self.usernames),
+                permalink=f"/r/{subreddit}/comments/{post_id}/",
+                title=f"{rng.choice(SAMPLE_POSTS)} ({keyword})",
+                score=int(rng.paretovariate(1.2)),
+                url=f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/",
+                created_utc=self.now - rng.uniform(0, 7 * 86400)
+            )
+
+
+class FakeReddit:
+    """
+    Stands in for a praw.Reddit client; search results come from a LoadGenerator.
+    
+    Like Reddit, a multireddit name (a+b) searches each subreddit and a
+    query of OR'd "phrases" returns every post mentioning any of them. The
+    corpus is the generator's posts for every topic keyword, so batched and
+    per-keyword searches see the same posts.
+    """
+    
+    def __init__(self, generator):
+        self.generator = generator
+    
+    def subreddit(self, name):
+        generator = self.generator
+        
+        def search(query, limit=None, time_filter=None):
+            # limit is ignored so the load can exceed the real API's page size
+            phrases = [phrase.lower() for phrase in re.findall(r'"([^"]+)"', query)] or [query.lower()]
+            for subreddit in name.split('+'):
+                for keyword in TOPIC_KEYWORDS:
+                    if any(re.search(rf'\b{re.escape(phrase)}\b', keyword.lower()) for phrase in phrases):
+                        yield from generator.reddit_posts(subreddit, keyword)
+        
+        return SimpleNamespace(search=search)
+
+
+class StubServer:
+    """
+    Local HTTP server standing in for Indeed (/jobs?q=...&start=...) and
+    publisher feeds (/rss/<n>), serving a LoadGenerator's payloads. Bodies
+    are gzipped for clients that accept it, as the real sites do.
+    """
+    
+    def __init__(self, generator, host='127.0.0.1', port=0):
+        self.generator = generator
+        handler = type('Handler', (_StubHandler,), {'generator': generator})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = None
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+    
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    generator = None
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        if parsed.path == '/jobs':
+            body = self.generator.indeed_page(query.get('q', [''])[0], int(query.get('start', ['0'])[0]))
+            content_type = 'text/html; charset=utf-8'
+        elif parsed.path.startswith('/rss/'):
+            body = self.generator.rss_feed(parsed.path[len('/rss/'):])
+            content_type = 'application/rss+xml; charset=utf-8'
+        else:
+            self.send_error(404)
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=5)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
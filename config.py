@@ -80,6 +80,25 @@ CONVERSATION_TOPICS = {
     ]
 }
 
+# Sources a run collects from (see connectors.py); `python main.py --sources ...` overrides
+SOURCES = ["indeed", "linkedin", "twitter", "reddit", "rss"]
+
+# Browser User-Agent strings, sampled once from fake_useragent's data and reused from disk
+USER_AGENTS = {
+    "cache_path": "data/user_agents.json",
+    "size": 20
+}
+
+# Social searches: CONVERSATION_TOPICS keywords are OR'd into as few queries as each
+# source allows, and results are attributed back to keywords locally
+QUERY_PLANNER = {
+    "enabled": True,  # False = one search per keyword
+    "max_query_length": {"Twitter": 512, "Reddit": 512},  # Characters per search query
+    "reddit_subreddits": ['cybersecurity', 'netsec', 'sysadmin', 'security', 'SaaS'],  # Searched together as a+b+c
+    "reddit_results_per_keyword": 25,  # Per subreddit, as separate searches used to fetch
+    "reddit_max_results": 1000  # One Reddit listing's limit; batches are kept small enough to fit
+}
+
 # Top 10 Cybersecurity Publishers
 CYBERSECURITY_PUBLISHERS = [
     {
@@ -138,7 +157,9 @@ CYBERSECURITY_PUBLISHERS = [
 JOB_BOARDS = {
     "indeed": {
         "base_url": "https://www.indeed.com/jobs",
-        "max_results": 1000
+        "max_results": 1000,
+        "page_size": 10,  # Indeed's "start" offset advances by 10 per results page
+        "parser": "lxml"  # Job card parser backend: lxml, strainer or soup (see job_parsers.py)
     },
     "linkedin": {
         "base_url": "https://www.linkedin.com/jobs/search",
@@ -162,4 +183,83 @@ SOCIAL_MEDIA = {
 OUTPUT_DIR = "outputs"
 TOP_COMPANIES_LIMIT = 1000
 TOP_PEOPLE_LIMIT = 500
+RUN_REPORT_FILE = "run_report.json"  # Per-run timings, latency histograms, bytes fetched and peak memory
+
+# Job postings whose title doesn't contain every word of some HIRING_KEYWORDS
+# keyword are dropped at ingest; verdicts for repeated titles are cached
+ROLE_RELEVANCE = {
+    "enabled": True,
+    "cache_size": 10000
+}
+
+# Output files are streamed in chunks; format is "csv", "csv.gz" or "parquet" (needs pyarrow)
+EXPORT_SETTINGS = {
+    "format": "csv",
+    "chunk_size": 5000
+}
+
+
+# Collection engine settings
+# Queries run concurrently, but never more than this many at once per host
+COLLECTION_SETTINGS = {
+    "default_host_concurrency": 2,
+    "host_concurrency": {
+        "www.indeed.com": 2,
+        "www.linkedin.com": 1,
+        "api.twitter.com": 2,
+        "oauth.reddit.com": 1  # PRAW instances are not thread-safe
+    }
+}
+
+# Request budgets per host, enforced by a token bucket shared by all sessions.
+# "burst" defaults to "requests", i.e. a full window may be spent at once.
+RATE_LIMITS = {
+    "default": {"requests": 5, "per_seconds": 1},  # Publisher RSS feeds and other hosts
+    "www.indeed.com": {"requests": 2, "per_seconds": 1},
+    "www.linkedin.com": {"requests": 1, "per_seconds": 5},
+    "api.twitter.com": {"requests": 300, "per_seconds": 900},
+    "oauth.reddit.com": {"requests": 60, "per_seconds": 60}
+}
+
+# Sharded crawl: work units are queued in SQLite under work_dir and drained by
+# a pool of worker processes; workers on other machines can join via a shared work_dir,
+# which then needs journal_mode "DELETE" on every machine (WAL only works on a local disk)
+SHARDING = {
+    "workers": 1,  # 1 = collect in-process
+    "work_dir": "data/shards",
+    "lease_seconds": 900,  # Renewed by a live worker; a dead worker's units are handed out again after this long
+    "max_attempts": 3,
+    "batch_size": 16,  # Units a worker claims at once and runs concurrently within its host limits
+    "poll_seconds": 5,  # How often the coordinator checks for units still held by remote workers
+    "journal_mode": "WAL"  # SQLite journal of the queue and shard stores; "DELETE" for a network work_dir
+}
 
+# Persistent signal store for incremental weekly runs
+SIGNAL_STORE_PATH = "data/signals.db"
+SIGNAL_WINDOW_DAYS = 30  # Rankings are recomputed over items first seen in this window
+
+# On-disk HTTP cache shared by tracker sessions
+HTTP_CACHE = {
+    "path": "data/http_cache",
+    "fresh_seconds": 6 * 3600,  # Served without any request (reruns, retries after a failure)
+    "max_age_seconds": 14 * 86400,  # Older entries are evicted
+    "max_bytes": 200 * 1024 * 1024  # Least recently used entries are evicted past this size
+}
+
+# Connection handling for every tracker session. Each host's connection pool is sized
+# to its COLLECTION_SETTINGS concurrency, so every collection thread keeps a warm connection.
+HTTP_CLIENT = {
+    "pool_connections": 20,  # Hosts whose pools are kept open by the default adapter
+    "retries": 2,  # Retries of connection errors and retryable statuses, with exponential backoff
+    "backoff_factor": 0.5,
+    "retry_statuses": [429, 500, 502, 503, 504]  # Retry-After is honored on 429/503
+}
+
+# Company entity resolution
+ENTITY_RESOLUTION = {
+    "cache_path": "data/company_entities.json",  # Canonical-name mapping kept between runs
+    "similarity_threshold": 0.85,  # Trigram Dice similarity needed to merge two names
+    "block_prefix_length": 4,  # Names are blocked on their tokens and each token's first characters
+    "max_block_size": 500,  # Blocking keys shared by more companies than this are too common to block on
+    "name_cache_size": 100000  # Cleaned display names memoized across keywords and runs
+}
@@ -0,0 +1,85 @@
+"""
+Source Connectors
+Registry of the sources a run can collect from. A connector's client and its
+heavy dependencies are loaded the first time the source is used, so a run
+restricted to some sources never pays for the others
+"""
+
+import os
+import threading
+from config import SOURCES
+
+# Source name -> label used in records and work units, and what it collects
+CONNECTORS = {
+    'indeed': {'label': 'Indeed', 'kind': 'hiring'},
+    'linkedin': {'label': 'LinkedIn', 'kind': 'hiring'},
+    'twitter': {'label': 'Twitter', 'kind': 'posts'},
+    'reddit': {'label': 'Reddit', 'kind': 'posts'},
+    'rss': {'label': 'RSS', 'kind': 'feeds'}
+}
+
+
+def _load_indeed():
+    """Job card parser backends (lxml, BeautifulSoup)"""
+    import job_parsers
+    return job_parsers
+
+
+def _load_reddit():
+    """praw client from REDDIT_CLIENT_ID / REDDIT_CLIENT_SECRET, or None when not configured"""
+    client_id = os.environ.get('REDDIT_CLIENT_ID')
+    client_secret = os.environ.get('REDDIT_CLIENT_SECRET')
+    if not (client_id and client_secret):
+        return None
+    try:
+        import praw
+        return praw.Reddit(client_id=client_id, client_secret=client_secret, user_agent="SaaS Security Tracker")
+    except Exception as e:
+        print(f"Error creating Reddit client: {str(e)}")
+        return None
+
+
+def _load_rss():
+    """Feed parser for publisher RSS payloads"""
+    import feedparser
+    return feedparser
+
+
+# LinkedIn and Twitter searches are simulated and load nothing
+LOADERS = {
+    'indeed': _load_indeed,
+    'reddit': _load_reddit,
+    'rss': _load_rss
+}
+
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+def load_connector(name):
+    """The client a source needs, loaded on first use (None if it needs none)"""
+    with _loaded_lock:
+        if name not in _loaded:
+            loader = LOADERS.get(name)
+            _loaded[name] = loader() if loader is not None else None
+        return _loaded[name]
+
+
+def validate_sources(sources):
+    """Raise ValueError for any source name that has no connector"""
+    unknown = [name for name in sources if name not in CONNECTORS]
+    if unknown:
+        raise ValueError(f"Unknown source(s): {', '.join(unknown)} (expected any of {', '.join(CONNECTORS)})")
+    return sources
+
+
+def enabled_sources(kind, sources=None):
+    """Labels of the enabled sources collecting kind, in registry order (sources defaults to SOURCES)"""
+    sources = validate_sources(SOURCES if sources is None else sources)
+    return [connector['label'] for name, connector in CONNECTORS.items()
+            if connector['kind'] == kind and name in sources]
+
+
+def all_sources(kind):
+    """Labels of every registered source collecting kind"""
+    return enabled_sources(kind, list(CONNECTORS))
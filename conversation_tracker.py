@@ -3,41 +3,69 @@ Conversation Signal Tracker
 Identifies people and publishers discussing SaaS security topics
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import feedparser
 import time
+import calendar
+import math
 from datetime import datetime, timedelta
-from fake_useragent import UserAgent
-from config import CONVERSATION_TOPICS, CYBERSECURITY_PUBLISHERS, TOP_PEOPLE_LIMIT
-import praw
+from functools import partial
+from itertools import islice
+from config import (
+    CONVERSATION_TOPICS, CYBERSECURITY_PUBLISHERS, TOP_PEOPLE_LIMIT, SIGNAL_WINDOW_DAYS, QUERY_PLANNER
+)
+from collection_engine import CollectionEngine, CollectionTask, host_of
+from connectors import all_sources, enabled_sources, load_connector
+from http_client import create_session, random_user_agent
+from instrumentation import metrics
+from keyword_matcher import KeywordMatcher, default_matcher
+from query_planner import QueryBatch, plan_queries
+from rate_limiter import rate_limiter
+from ranking import top_k
+from records import Article, Person, Post, Publisher
+from scoring import influence_score
 import json
 
-ua = UserAgent()
+POST_SOURCE_HOSTS = {'Twitter': 'api.twitter.com', 'Reddit': 'oauth.reddit.com'}
+REDDIT_PAGE_SIZE = 100  # Submissions per listing request; larger limits cost one request per page
+
+
+def feed_unit_id(publisher_name):
+    """Stable ID of one publisher feed fetch for checkpoints and work queues"""
+    return f"feed|{publisher_name}"
+
+def conversation_keywords():
+    """Every CONVERSATION_TOPICS keyword, in config order"""
+    return [keyword for keywords in CONVERSATION_TOPICS.values() for keyword in keywords]
+
+def plan_post_queries(source):
+    """Batched searches covering every conversation keyword on a social platform"""
+    max_terms = None
+    if source == 'Reddit':
+        # Keep each batch's combined result limit within one listing
+        per_term = QUERY_PLANNER['reddit_results_per_keyword'] * len(QUERY_PLANNER['reddit_subreddits'])
+        max_terms = max(1, QUERY_PLANNER['reddit_max_results'] // per_term)
+    return plan_queries(source, conversation_keywords(), max_terms=max_terms)
+
+PEOPLE_OUTPUT_COLUMNS = [
+    'Rank', 'Username/ID', 'Platform', 'Engagement Score', 'Influence Score',
+    'Topics Discussed', 'Number of Posts', 'Sample Post', 'Last Updated'
+]
+PUBLISHER_OUTPUT_COLUMNS = [
+    'Rank', 'Publisher Name', 'Relevance Score', 'Number of Articles', 'Topics Covered',
+    'Website URL', 'Sample Article', 'Last Updated'
+]
 
 class ConversationTracker:
-    def __init__(self):
+    def __init__(self, sources=None):
         self.people = {}
         self.publishers = {}
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': ua.random
-        })
+        self.session = create_session(random_user_agent())
+        # Platforms and feeds to collect: the enabled connectors (SOURCES unless sources is given)
+        self.post_sources = enabled_sources('posts', sources)
+        self.collect_feeds = bool(enabled_sources('feeds', sources))
         
-        # Initialize Reddit API (requires credentials in production)
-        # For demo, we'll use a placeholder
+        # Reddit API client; when left as None the Reddit connector is loaded on the
+        # first search (it needs REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET set)
         self.reddit = None
-        try:
-            # In production, set these as environment variables
-            # self.reddit = praw.Reddit(
-            #     client_id="your_client_id",
-            #     client_secret="your_client_secret",
-            #     user_agent="SaaS Security Tracker"
-            # )
-            pass
-        except:
-            pass
     
     def search_twitter_simulated(self, keyword):
         """
@@ -45,7 +73,7 @@ class ConversationTracker:
         Note: Twitter API v2 requires authentication
         In production, use tweepy with API credentials
         """
-        people = {}
+        posts = []
         
         print(f"[Twitter] Simulated search for: {keyword}")
         print("[Twitter] Note: Actual Twitter search requires API credentials")
@@ -53,6 +81,7 @@ class ConversationTracker:
         # Example with tweepy (commented out - requires API keys):
         # import tweepy
         # client = tweepy.Client(bearer_token="your_token")
+        # rate_limiter.acquire('api.twitter.com')
         # tweets = client.search_recent_tweets(
         #     query=keyword,
         #     max_results=100,
@@ -62,224 +91,383 @@ class ConversationTracker:
         #     author_id = tweet.author_id
         #     # Get user info and track
         
-        return people
+        return posts
     
-    def search_reddit(self, keyword, subreddits=None):
-        """Search Reddit for discussions"""
-        people = {}
+    def search_twitter_batch(self, batch, since=None):
+        """Run one batched Twitter/X query; results are attributed to the batch's keywords"""
+        return self.search_twitter_simulated(batch.query)
+    
+    def search_reddit(self, keyword, subreddits=None, since=None):
+        """
+        Search Reddit for discussions
+        
+        Returns a list of post dicts. Posts created at or before the since
+        timestamp (the previous run) are skipped.
+        """
+        return self.search_reddit_batch(QueryBatch('Reddit', [keyword], [keyword]), subreddits, since)
+    
+    def search_reddit_batch(self, batch, subreddits=None, since=None):
+        """
+        Search Reddit for a batched query across all subreddits at once
+        
+        The subreddits are searched together as one multireddit (a+b+c).
+        Each post becomes one post dict per batch keyword it mentions; posts
+        created at or before since are skipped. A failed search raises.
+        """
+        found_posts = []
         
         if subreddits is None:
-            subreddits = ['cybersecurity', 'netsec', 'sysadmin', 'security', 'SaaS']
+            subreddits = QUERY_PLANNER['reddit_subreddits']
         
-        if self.reddit is None:
-            print(f"[Reddit] Simulated search for: {keyword}")
+        reddit = self.reddit if self.reddit is not None else load_connector('reddit')
+        if reddit is None:
+            print(f"[Reddit] Simulated search for: {batch.query}")
             print("[Reddit] Note: Actual Reddit search requires PRAW credentials")
-            return people
+            return found_posts
+        
+        limit = min(
+            QUERY_PLANNER['reddit_results_per_keyword'] * len(subreddits) * len(batch.terms),
+            QUERY_PLANNER['reddit_max_results']
+        )
+        unattributed = 0
+        with metrics.timer('search.reddit'):
+            try:
+                subreddit = reddit.subreddit('+'.join(subreddits))
+                rate_limiter.acquire('oauth.reddit.com', math.ceil(limit / REDDIT_PAGE_SIZE))
+                posts = subreddit.search(batch.query, limit=limit, time_filter='week')
+                
+                for post in posts:
+                    if since is not None and post.created_utc <= since:
+                        continue
+                    author = str(post.author)
+                    if not author or author == 'None':
+                        continue
+                    keywords = batch.attribute(post.title, getattr(post, 'selftext', ''))
+                    if not keywords:
+                        unattributed += 1
+                    for keyword in keywords:
+                        found_posts.append({
+                            'id': f"https://www.reddit.com{post.permalink}",
+                            'author': author,
+                            'platform': 'Reddit',
+                            'title': post.title,
+                            'score': post.score,
+                            'url': post.url,
+                            'created': datetime.fromtimestamp(post.created_utc).isoformat(),
+                            'keyword': keyword
+                        })
+            except Exception as e:
+                print(f"Error in Reddit search: {str(e)}")
+                raise
+        metrics.count('items.reddit', len(found_posts))
+        metrics.count('items.reddit.unattributed', unattributed)
+        
+        return found_posts
+    
+    def fetch_publisher_feeds(self):
+        """Download and parse every publisher RSS feed once per run (a feed that fails is left empty)"""
+        feeds = {}
         
+        for publisher in CYBERSECURITY_PUBLISHERS:
+            try:
+                feeds[publisher['name']] = self.fetch_publisher_feed(publisher)
+            except Exception:
+                feeds[publisher['name']] = []
+        
+        return feeds
+    
+    def fetch_publisher_feed(self, publisher):
+        """Fetch a single publisher feed into an in-memory snapshot of entries; raises if it fails"""
+        entries = []
         try:
-            for subreddit_name in subreddits:
-                try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-                    posts = subreddit.search(keyword, limit=25, time_filter='week')
-                    
-                    for post in posts:
-                        author = str(post.author)
-                        if author and author != 'None':
-                            if author not in people:
-                                people[author] = {
-                                    'username': author,
-                                    'platform': 'Reddit',
-                                    'posts': [],
-                                    'topics': set(),
-                                    'engagement': 0
-                                }
-                            people[author]['posts'].append({
-                                'title': post.title,
-                                'score': post.score,
-                                'url': post.url,
-                                'created': datetime.fromtimestamp(post.created_utc).isoformat()
-                            })
-                            people[author]['topics'].add(keyword)
-                            people[author]['engagement'] += post.score
-                except Exception as e:
-                    print(f"Error searching subreddit {subreddit_name}: {str(e)}")
-                    continue
+            print(f"Fetching {publisher['name']} feed...")
+            
+            # Fetch through the rate-limited session, then parse the RSS payload
+            with metrics.timer('rss.fetch'):
+                response = self.session.get(publisher['rss'], timeout=10)
+            response.raise_for_status()
+            with metrics.timer('rss.parse'):
+                feed = load_connector('rss').parse(response.content)
+            
+            for entry in feed.entries[:20]:  # Limit per publisher
+                entries.append({
+                    'title': entry.get('title', ''),
+                    'link': entry.get('link', ''),
+                    'published': entry.get('published', ''),
+                    'published_ts': calendar.timegm(entry.published_parsed) if entry.get('published_parsed') else None,
+                    'summary': entry.get('summary', '')
+                })
         except Exception as e:
-            print(f"Error in Reddit search: {str(e)}")
+            print(f"Error fetching {publisher['name']}: {str(e)}")
+            raise
         
-        return people
+        metrics.count('items.rss', len(entries))
+        return entries
     
-    def search_publishers(self, keyword):
-        """Search top cybersecurity publishers via RSS feeds"""
-        publisher_data = {}
+    def search_publishers(self, keywords, feeds=None):
+        """
+        Match keywords against a snapshot of publisher RSS feeds
+        
+        keywords may be a single keyword or a list; each entry is scanned
+        once by a multi-keyword matcher, however many keywords there are.
+        If no snapshot is given the feeds are fetched first.
+        """
+        if feeds is None:
+            feeds = self.fetch_publisher_feeds()
+        
+        return self.aggregate_articles(self.match_publisher_articles(keywords, feeds))
+    
+    def match_publisher_articles(self, keywords, feeds, since=None):
+        """
+        Return one article dict per (entry, matching keyword) in the feed snapshot
+        
+        Entries published at or before the since timestamp are skipped.
+        """
+        with metrics.timer('search.publishers'):
+            articles = self._match_publisher_articles(keywords, feeds, since)
+        metrics.count('items.articles', len(articles))
+        return articles
+    
+    def _match_publisher_articles(self, keywords, feeds, since):
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        
+        # The shared matcher covers every configured keyword; anything else gets its own
+        matcher = default_matcher()
+        if not matcher.covers(keywords):
+            matcher = KeywordMatcher({None: keywords})
+        
+        requested = {}  # lowercased keyword -> keywords as given
+        for keyword in keywords:
+            requested.setdefault(keyword.lower(), []).append(keyword)
+        articles = []
         
         for publisher in CYBERSECURITY_PUBLISHERS:
-            try:
-                print(f"Searching {publisher['name']} for: {keyword}")
-                
-                # Parse RSS feed
-                feed = feedparser.parse(publisher['rss'])
+            publisher_name = publisher['name']
+            
+            for entry in feeds.get(publisher_name, []):
+                if since is not None and entry['published_ts'] is not None and entry['published_ts'] <= since:
+                    continue
                 
-                for entry in feed.entries[:20]:  # Limit per publisher
-                    # Check if keyword appears in title or summary
-                    title = entry.get('title', '').lower()
-                    summary = entry.get('summary', '').lower()
-                    keyword_lower = keyword.lower()
-                    
-                    if keyword_lower in title or keyword_lower in summary:
-                        publisher_name = publisher['name']
-                        
-                        if publisher_name not in publisher_data:
-                            publisher_data[publisher_name] = {
-                                'publisher': publisher_name,
-                                'articles': [],
-                                'topics': set(),
-                                'url': publisher['url']
-                            }
-                        
-                        publisher_data[publisher_name]['articles'].append({
-                            'title': entry.get('title', ''),
-                            'link': entry.get('link', ''),
-                            'published': entry.get('published', ''),
-                            'summary': entry.get('summary', '')[:200]  # First 200 chars
+                # One scan of title and summary finds every keyword they mention
+                for matched in matcher.match(entry['title'], entry['summary']):
+                    for keyword in requested.get(matched, ()):
+                        articles.append({
+                            'id': entry['link'] or f"{publisher_name}|{entry['title']}",
+                            'publisher': publisher_name,
+                            'title': entry['title'],
+                            'link': entry['link'],
+                            'published': entry['published'],
+                            'summary': entry['summary'][:200],  # First 200 chars
+                            'keyword': keyword
                         })
-                        publisher_data[publisher_name]['topics'].add(keyword)
-                
-                time.sleep(1)  # Rate limiting
-                
-            except Exception as e:
-                print(f"Error searching {publisher['name']}: {str(e)}")
-                continue
+        
+        return articles
+    
+    def aggregate_articles(self, articles):
+        """Aggregate matched articles into per-publisher records"""
+        publisher_urls = {publisher['name']: publisher['url'] for publisher in CYBERSECURITY_PUBLISHERS}
+        publisher_data = {}
+        
+        for article in articles:
+            publisher_name = article['publisher']
+            publisher = publisher_data.get(publisher_name)
+            if publisher is None:
+                publisher = publisher_data[publisher_name] = Publisher(
+                    publisher_name, publisher_urls.get(publisher_name, '')
+                )
+            
+            publisher.add_article(
+                Article(article['title'], article['link'], article['published'], article['summary']),
+                article['keyword']
+            )
         
         return publisher_data
     
-    def collect_conversation_signals(self):
-        """Collect conversation signals from all sources"""
+    def aggregate_posts(self, posts):
+        """Aggregate posts into per-author records"""
+        all_people = {}
+        
+        for post in posts:
+            author = post['author']
+            person = all_people.get(author)
+            if person is None:
+                person = all_people[author] = Person(author, post['platform'])
+            
+            person.add_post(
+                Post(post['title'], post['score'], post['url'], post['created']),
+                post['keyword']
+            )
+        
+        return all_people
+    
+    def conversation_tasks(self, since=None, checkpoint=None):
+        """
+        Build collection tasks: one per publisher feed and per batched platform query
+        
+        Each task's context is (kind, name, unit_id); units the checkpoint
+        has recorded as done are left out.
+        """
+        tasks = []
+        publishers = CYBERSECURITY_PUBLISHERS if self.collect_feeds else []
+        
+        for publisher in publishers:
+            unit_id = feed_unit_id(publisher['name'])
+            if checkpoint is None or not checkpoint.is_done(unit_id):
+                tasks.append(CollectionTask(
+                    host_of(publisher['rss']), self.fetch_publisher_feed, (publisher,),
+                    ('feed', publisher['name'], unit_id)
+                ))
+        
+        for source in self.post_sources:
+            for batch in plan_post_queries(source):
+                if checkpoint is None or not checkpoint.is_done(batch.unit_id):
+                    tasks.append(CollectionTask(
+                        POST_SOURCE_HOSTS[source], self.post_searcher(source, since), (batch,),
+                        ('posts', source, batch.unit_id)
+                    ))
+        
+        return tasks
+    
+    def post_searcher(self, source, since=None):
+        """Return the batched query search function for a social platform"""
+        if source == 'Twitter':
+            return partial(self.search_twitter_batch, since=since)
+        if source == 'Reddit':
+            return partial(self.search_reddit_batch, since=since)
+        raise ValueError(f"Unknown post source '{source}'")
+    
+    def collect_conversation_signals(self, engine=None, store=None, checkpoint=None):
+        """
+        Collect conversation signals from all sources
+        
+        With a SignalStore, only posts and articles newer than the last run
+        are processed and stored, and people/publishers are aggregated from
+        everything the store has seen within SIGNAL_WINDOW_DAYS. Each unit's
+        items are stored as soon as it finishes, and with a RunCheckpoint
+        units an interrupted attempt at this run already finished are skipped.
+        The high-water mark only moves once every unit has succeeded.
+        """
+        if engine is None:
+            with CollectionEngine() as engine:
+                return self.collect_conversation_signals(engine, store, checkpoint)
+        
         print("Collecting conversation signals...")
         
-        all_people = {}
-        all_publishers = {}
+        run_started = checkpoint.run_started if checkpoint is not None else time.time()
+        last_run = store.get_high_water_mark('conversation') if store is not None else None
+        all_keywords = conversation_keywords()
         
-        # Search across all topics
-        for topic, keywords in CONVERSATION_TOPICS.items():
-            print(f"Searching for discussions about: {topic}")
+        posts = []
+        articles = []
+        new_posts = new_articles = failed = 0
+        
+        # Feed snapshots and per-keyword platform searches run concurrently
+        for task, result in engine.run(self.conversation_tasks(last_run, checkpoint)):
+            kind, name, unit_id = task.context
+            if result is None:
+                # A failed unit is left for a resumed run to retry
+                failed += 1
+                if checkpoint is not None:
+                    checkpoint.unit_failed(unit_id)
+                continue
+            if kind == 'feed':
+                # Publishers: one pass over the feed for every keyword
+                items = self.match_publisher_articles(all_keywords, {name: result}, since=last_run)
+            else:
+                items = result
             
-            for keyword in keywords:
-                # Twitter/X
-                twitter_people = self.search_twitter_simulated(keyword)
-                for username, data in twitter_people.items():
-                    if username not in all_people:
-                        all_people[username] = data
-                    else:
-                        all_people[username]['posts'].extend(data['posts'])
-                        all_people[username]['topics'].update(data['topics'])
-                        all_people[username]['engagement'] += data['engagement']
-                
-                # Reddit
-                reddit_people = self.search_reddit(keyword)
-                for username, data in reddit_people.items():
-                    if username not in all_people:
-                        all_people[username] = data
-                    else:
-                        all_people[username]['posts'].extend(data['posts'])
-                        all_people[username]['topics'].update(data['topics'])
-                        all_people[username]['engagement'] += data['engagement']
-                
-                # Publishers
-                publisher_results = self.search_publishers(keyword)
-                for pub_name, pub_data in publisher_results.items():
-                    if pub_name not in all_publishers:
-                        all_publishers[pub_name] = pub_data
-                    else:
-                        all_publishers[pub_name]['articles'].extend(pub_data['articles'])
-                        all_publishers[pub_name]['topics'].update(pub_data['topics'])
-                
-                time.sleep(1)  # Rate limiting
+            if store is None:
+                (articles if kind == 'feed' else posts).extend(items)
+                continue
+            if kind == 'feed':
+                new_articles += len(store.add_articles(items))
+            else:
+                new_posts += len(store.add_posts(items))
+            if checkpoint is not None:
+                checkpoint.unit_done(unit_id)
         
-        # Convert sets to lists
-        for person in all_people.values():
-            person['topics'] = list(person['topics'])
+        if store is None:
+            return self.aggregate_posts(posts), self.aggregate_articles(articles)
         
-        for publisher in all_publishers.values():
-            publisher['topics'] = list(publisher['topics'])
+        print(f"Stored {new_posts} new posts and {new_articles} new articles")
+        if failed:
+            # The next run has to search the failed units' window again
+            print(f"{failed} conversation units failed: conversation high-water mark left unchanged")
+        elif self.post_sources == all_sources('posts') and self.collect_feeds:
+            store.set_high_water_mark('conversation', run_started)
+        else:
+            # The skipped sources still need everything since the last full run
+            print("Partial source run: conversation high-water mark left unchanged")
         
+        window_start = run_started - SIGNAL_WINDOW_DAYS * 86400
+        all_people = self.aggregate_posts(store.iter_posts(since=window_start))
+        all_publishers = self.aggregate_articles(store.iter_articles(since=window_start))
         return all_people, all_publishers
     
     def rank_people(self, people):
-        """Rank people by engagement and relevance"""
-        people_list = list(people.values())
+        """
+        Rank people by engagement and relevance
         
-        # Sort by engagement (score, upvotes, etc.)
-        people_list.sort(key=lambda x: x['engagement'], reverse=True)
+        Only the top TOP_PEOPLE_LIMIT are kept while scanning; ties on
+        engagement are broken by number of posts, then number of topics.
+        """
+        records = people.values() if isinstance(people, dict) else people
+        ranked = top_k(records, TOP_PEOPLE_LIMIT, key=lambda person: (
+            person.engagement,
+            person.post_count,
+            len(person.topics)
+        ))
         
         # Add ranking
-        for i, person in enumerate(people_list[:TOP_PEOPLE_LIMIT], 1):
-            person['rank'] = i
-            person['influence_score'] = self._calculate_influence_score(person)
+        for i, person in enumerate(ranked, 1):
+            person.rank = i
+            person.influence_score = influence_score(person)
         
-        return people_list[:TOP_PEOPLE_LIMIT]
+        return ranked
     
     def rank_publishers(self, publishers):
-        """Rank publishers by article count and relevance"""
-        publisher_list = list(publishers.values())
+        """Rank publishers by article count, then breadth of topics covered"""
+        records = publishers.values() if isinstance(publishers, dict) else publishers
         
-        # Sort by number of relevant articles
-        publisher_list.sort(key=lambda x: len(x['articles']), reverse=True)
+        # Publishers are a short, fixed list, so a full sort is fine here
+        ranked = sorted(records, key=lambda publisher: (
+            publisher.article_count,
+            len(publisher.topics)
+        ), reverse=True)
         
         # Add ranking
-        for i, publisher in enumerate(publisher_list, 1):
-            publisher['rank'] = i
-            publisher['relevance_score'] = len(publisher['articles'])
+        for i, publisher in enumerate(ranked, 1):
+            publisher.rank = i
+            publisher.relevance_score = publisher.article_count
         
-        return publisher_list
+        return ranked
     
-    def _calculate_influence_score(self, person):
-        """Calculate influence score based on engagement"""
-        score = person['engagement']
-        
-        if score >= 1000:
-            return "Very High"
-        elif score >= 500:
-            return "High"
-        elif score >= 100:
-            return "Medium"
-        else:
-            return "Low"
-    
-    def generate_people_output(self, ranked_people):
-        """Generate CSV output for people"""
-        df_data = []
+    def iter_people_rows(self, ranked_people, timestamp):
+        """Yield one output row per ranked person, in PEOPLE_OUTPUT_COLUMNS order"""
         for person in ranked_people:
-            df_data.append({
-                'Rank': person['rank'],
-                'Username/ID': person['username'],
-                'Platform': person['platform'],
-                'Engagement Score': person['engagement'],
-                'Influence Score': person['influence_score'],
-                'Topics Discussed': ', '.join(person['topics'][:5]),
-                'Number of Posts': len(person['posts']),
-                'Sample Post': person['posts'][0]['title'] if person['posts'] else '',
-                'Last Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
-        
-        df = pd.DataFrame(df_data)
-        return df
+            yield (
+                person.rank,
+                person.username,
+                person.platform,
+                person.engagement,
+                person.influence_score,
+                ', '.join(islice(person.topics, 5)),
+                person.post_count,
+                person.posts[0].title if person.posts else '',
+                timestamp
+            )
     
-    def generate_publishers_output(self, ranked_publishers):
-        """Generate CSV output for publishers"""
-        df_data = []
+    def iter_publisher_rows(self, ranked_publishers, timestamp):
+        """Yield one output row per ranked publisher, in PUBLISHER_OUTPUT_COLUMNS order"""
         for publisher in ranked_publishers:
-            df_data.append({
-                'Rank': publisher['rank'],
-                'Publisher Name': publisher['publisher'],
-                'Relevance Score': publisher['relevance_score'],
-                'Number of Articles': len(publisher['articles']),
-                'Topics Covered': ', '.join(publisher['topics'][:5]),
-                'Website URL': publisher['url'],
-                'Sample Article': publisher['articles'][0]['title'] if publisher['articles'] else '',
-                'Last Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
-        
-        df = pd.DataFrame(df_data)
-        return df
-
+            yield (
+                publisher.rank,
+                publisher.publisher,
+                publisher.relevance_score,
+                publisher.article_count,
+                ', '.join(islice(publisher.topics, 5)),
+                publisher.url,
+                publisher.articles[0].title if publisher.articles else '',
+                timestamp
+            )
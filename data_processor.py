@@ -3,81 +3,64 @@ Data Processing Module
 Handles data cleaning, deduplication, and enrichment
 """
 
-import pandas as pd
-import re
 from datetime import datetime
+from entity_resolution import CompanyResolver, clean_company_name
+from keyword_matcher import RoleClassifier, default_role_classifier
+from scoring import estimated_size, hiring_intensity
+from config import ENTITY_RESOLUTION
 
 class DataProcessor:
-    def __init__(self):
-        pass
+    def __init__(self, resolver=None):
+        self.resolver = resolver or CompanyResolver(ENTITY_RESOLUTION['cache_path'])
     
     def clean_company_name(self, name):
         """Clean and normalize company names"""
-        if not name:
-            return ""
-        
-        # Remove common suffixes/prefixes
-        name = re.sub(r'\s+Inc\.?$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s+LLC\.?$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s+Corp\.?$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s+Ltd\.?$', '', name, flags=re.IGNORECASE)
-        
-        # Remove extra whitespace
-        name = ' '.join(name.split())
-        
-        return name.strip()
+        return clean_company_name(name)
     
     def deduplicate_companies(self, companies):
-        """Deduplicate companies with similar names"""
-        # Group by normalized name
-        normalized_map = {}
+        """
+        Deduplicate companies whose names resolve to the same entity
+        
+        Takes ownership of the company records: the first record for each
+        entity absorbs the others and is renamed to the canonical name.
+        """
+        # Group by canonical entity
+        canonical_map = {}
         
         for company in companies:
-            normalized = self.clean_company_name(company['company_name']).lower()
+            canonical = self.resolver.resolve(
+                company.company_name, self.clean_company_name(company.company_name)
+            )
             
-            if normalized not in normalized_map:
-                normalized_map[normalized] = company
+            if canonical not in canonical_map:
+                company.company_name = self.resolver.display_name(canonical)
+                canonical_map[canonical] = company
             else:
-                # Merge data
-                existing = normalized_map[normalized]
-                existing['total_jobs'] += company['total_jobs']
-                existing['categories'] = list(set(existing['categories'] + company['categories']))
-                existing['roles'].extend(company['roles'])
-                existing['sources'] = list(set(existing['sources'] + company['sources']))
+                # Merge into the first record in place
+                canonical_map[canonical].merge(company)
         
-        return list(normalized_map.values())
+        return list(canonical_map.values())
+    
+    def save_entity_cache(self):
+        """Persist resolved company names so the next run starts from them"""
+        self.resolver.save()
     
     def enrich_company_data(self, company):
         """Add additional metadata to company records"""
-        # Add company size estimate based on job count
-        if company['total_jobs'] >= 20:
-            company['estimated_size'] = 'Large'
-        elif company['total_jobs'] >= 10:
-            company['estimated_size'] = 'Medium'
-        else:
-            company['estimated_size'] = 'Small'
-        
-        # Add hiring intensity
-        if company['total_jobs'] >= 15:
-            company['hiring_intensity'] = 'Very Active'
-        elif company['total_jobs'] >= 8:
-            company['hiring_intensity'] = 'Active'
-        elif company['total_jobs'] >= 3:
-            company['hiring_intensity'] = 'Moderate'
-        else:
-            company['hiring_intensity'] = 'Low'
-        
+        company.estimated_size = estimated_size(company)
+        company.hiring_intensity = hiring_intensity(company)
         return company
     
-    def filter_relevant_roles(self, roles, keywords):
-        """Filter roles to only include relevant ones"""
-        relevant_roles = []
-        keyword_lower = [k.lower() for k in keywords]
-        
-        for role in roles:
-            role_lower = role.lower()
-            if any(kw in role_lower for kw in keyword_lower):
-                relevant_roles.append(role)
+    def enrich_companies(self, companies):
+        """enrich_company_data over a list of company records"""
+        for company in companies:
+            self.enrich_company_data(company)
+        return companies
+    
+    def filter_relevant_roles(self, roles, keywords=None):
+        """Filter roles to only include relevant ones (HIRING_KEYWORDS unless keywords are given)"""
+        classifier = default_role_classifier() if keywords is None else RoleClassifier({None: keywords})
+        relevant_roles = [role for role in roles if classifier.is_relevant(role)]
         
         return relevant_roles if relevant_roles else roles[:3]  # Return top 3 if no match
 
@@ -0,0 +1,182 @@
+"""
+Company Entity Resolution
+Maps company name variants ("Shopify Inc." / "Shopify, Inc", "Salesforce.com" /
+"Salesforce") onto one canonical company
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+from functools import lru_cache
+from config import ENTITY_RESOLUTION
+
+# Trailing tokens that don't distinguish one company from another
+LEGAL_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'corp', 'corporation', 'ltd', 'limited',
+    'co', 'company', 'plc', 'gmbh', 'ag', 'sa', 'bv', 'nv', 'lp', 'llp'
+}
+
+# Legal suffixes as written in display names: "Inc.", ", Inc", "S.A.", "Co., Ltd.", "B.V."
+_SUFFIX_SPELLINGS = sorted(
+    (r'\.?'.join(suffix) if len(suffix) == 2 else suffix for suffix in LEGAL_SUFFIXES),
+    key=len, reverse=True
+)
+_DISPLAY_SUFFIX = re.compile(
+    r"(?:\.com)?(?:[\s,&]+(?:" + '|'.join(_SUFFIX_SPELLINGS) + r")\.?)*[\s.,]*$",
+    re.IGNORECASE
+)
+_JOINED_PUNCTUATION = re.compile(r"[.,']")
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_DOT_COM = re.compile(r'\.com\b')
+
+
+def normalize_company_key(name):
+    """Lowercased, punctuation-free, suffix-free key used to compare names"""
+    name = name.lower().replace('&', ' and ')
+    name = _DOT_COM.sub('', name)
+    name = _JOINED_PUNCTUATION.sub('', name)  # "S.A." -> "sa", "Inc." -> "inc"
+    tokens = _NON_ALNUM.sub(' ', name).split()
+    
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    
+    return ' '.join(tokens)
+
+
+@lru_cache(maxsize=ENTITY_RESOLUTION['name_cache_size'])
+def clean_company_name(name):
+    """
+    Display form of a company name: whitespace collapsed and trailing legal
+    suffixes, ".com" and leftover punctuation removed ("CrowdStrike, Inc."
+    -> "CrowdStrike", "Salesforce.com" -> "Salesforce")
+    """
+    if not name:
+        return ""
+    
+    name = ' '.join(name.split())
+    cleaned = _DISPLAY_SUFFIX.sub('', name, count=1)
+    return cleaned or name
+
+
+def trigrams(key):
+    padded = f" {key.replace(' ', '')} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def blocking_keys(key, prefix_length=None):
+    """
+    Blocking keys of a normalized key: each token, each token's prefix and
+    the prefix of the whole name without spaces ("palo alto networks" ->
+    palo, alto, networks, netw), so typos past the prefix and names
+    written with or without spaces still share a block
+    """
+    prefix_length = prefix_length or ENTITY_RESOLUTION['block_prefix_length']
+    keys = dict.fromkeys([key.replace(' ', '')[:prefix_length]])
+    for token in key.split():
+        keys[token] = None
+        keys[token[:prefix_length]] = None
+    return list(keys)
+
+
+class CompanyResolver:
+    """
+    Resolves company names to canonical keys.
+    
+    Names are normalized first; exact key matches resolve immediately. New
+    keys are scored by trigram similarity only against companies sharing a
+    token or token prefix (the blocking index). Blocks shared by more than
+    max_block_size companies are too common to say anything and stop
+    growing, so the candidates per name stay bounded however large the
+    company set gets. The key -> canonical mapping and canonical display
+    names can be saved and reloaded between runs.
+    """
+    
+    def __init__(self, cache_path=None, threshold=None, max_block_size=None):
+        self.cache_path = cache_path
+        self.threshold = threshold or ENTITY_RESOLUTION['similarity_threshold']
+        self.max_block_size = max_block_size or ENTITY_RESOLUTION['max_block_size']
+        self.entities = {}  # canonical key -> display name
+        self.aliases = {}  # normalized key -> canonical key
+        self._grams = {}
+        self._index = defaultdict(list)  # blocking key -> canonical keys, up to max_block_size + 1
+        
+        if cache_path and os.path.exists(cache_path):
+            self.load(cache_path)
+    
+    def _add_entity(self, key, display_name):
+        self.entities[key] = display_name
+        self.aliases[key] = key
+        self._grams[key] = trigrams(key)
+        for block_key in blocking_keys(key):
+            block = self._index[block_key]
+            # An oversized block is never searched, so it stops growing
+            if len(block) <= self.max_block_size:
+                block.append(key)
+    
+    def _best_match(self, key):
+        candidates = {}
+        for block_key in blocking_keys(key):
+            block = self._index.get(block_key)
+            if block and len(block) <= self.max_block_size:
+                candidates.update(dict.fromkeys(block))
+        
+        grams = trigrams(key)
+        best_key = None
+        best_score = self.threshold
+        size = len(grams)
+        for candidate in candidates:
+            candidate_grams = self._grams[candidate]
+            total = size + len(candidate_grams)
+            # Cheap upper bound first: at most the smaller set can be shared
+            if 2 * min(size, len(candidate_grams)) / total < best_score:
+                continue
+            score = 2 * len(grams & candidate_grams) / total
+            if score >= best_score:
+                best_key, best_score = candidate, score
+        return best_key
+    
+    def resolve(self, name, display_name=None):
+        """
+        Return the canonical key for a company name
+        
+        An unseen company becomes a new canonical entity displayed as
+        display_name (or name).
+        """
+        key = normalize_company_key(name)
+        if not key:
+            key = name.strip().lower()
+        
+        canonical = self.aliases.get(key)
+        if canonical is None:
+            canonical = self._best_match(key)
+            if canonical is None:
+                self._add_entity(key, display_name or name)
+                canonical = key
+            else:
+                self.aliases[key] = canonical
+        return canonical
+    
+    def display_name(self, canonical):
+        return self.entities[canonical]
+    
+    def load(self, path):
+        with open(path) as f:
+            data = json.load(f)
+        for key, display_name in data.get('entities', {}).items():
+            self._add_entity(key, display_name)
+        self.aliases.update(data.get('aliases', {}))
+    
+    def save(self, path=None):
+        """Persist the canonical-name mapping for the next run"""
+        path = path or self.cache_path
+        if not path:
+            return
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'entities': self.entities, 'aliases': self.aliases}, f)
+        os.replace(tmp_path, path)
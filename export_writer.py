@@ -0,0 +1,120 @@
+"""
+Export Writer
+Streams ranked rows to CSV, gzip-compressed CSV or Parquet in fixed-size chunks
+"""
+
+import csv
+import gzip
+import os
+from config import EXPORT_SETTINGS
+
+FORMATS = {
+    'csv': '.csv',
+    'csv.gz': '.csv.gz',
+    'parquet': '.parquet'
+}
+
+
+def export_path(output_dir, name, format=None):
+    """Return the output file path for name in the given format"""
+    format = format or EXPORT_SETTINGS['format']
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format '{format}'. Available: {', '.join(FORMATS)}")
+    return os.path.join(output_dir, name + FORMATS[format])
+
+
+class ExportWriter:
+    """
+    Chunked writer for one output file.
+    
+    Rows are tuples in column order. At most chunk_size rows are buffered
+    before being written, so exporting never holds a full copy of the data.
+    """
+    
+    def __init__(self, path, columns, format=None, chunk_size=None):
+        self.path = path
+        self.columns = list(columns)
+        self.format = format or EXPORT_SETTINGS['format']
+        self.chunk_size = chunk_size or EXPORT_SETTINGS['chunk_size']
+        self.rows_written = 0
+        
+        self._buffer = []
+        self._file = None
+        self._csv = None
+        self._parquet = None
+        
+        if self.format == 'csv':
+            self._file = open(path, 'w', newline='', encoding='utf-8')
+        elif self.format == 'csv.gz':
+            self._file = gzip.open(path, 'wt', newline='', encoding='utf-8')
+        elif self.format == 'parquet':
+            try:
+                import pyarrow  # noqa: F401 - optional dependency, only needed for Parquet
+            except ImportError:
+                raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+        else:
+            raise ValueError(f"Unknown export format '{self.format}'. Available: {', '.join(FORMATS)}")
+        
+        if self._file is not None:
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(self.columns)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def write(self, row):
+        self._buffer.append(row)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+    
+    def write_rows(self, rows):
+        for row in rows:
+            self.write(row)
+    
+    def flush(self):
+        if not self._buffer:
+            return
+        if self._csv is not None:
+            self._csv.writerows(self._buffer)
+        else:
+            self._write_parquet_chunk(self._buffer)
+        self.rows_written += len(self._buffer)
+        self._buffer = []
+    
+    def _write_parquet_chunk(self, rows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        table = pa.Table.from_arrays(
+            [pa.array(column) for column in zip(*rows)],
+            names=self.columns
+        )
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self.path, table.schema)
+        self._parquet.write_table(table.cast(self._parquet.schema))
+    
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.format == 'parquet' and self._parquet is None:
+            # No rows at all: still leave a valid, empty file with the header schema
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            schema = pa.schema([(column, pa.string()) for column in self.columns])
+            self._parquet = pq.ParquetWriter(self.path, schema)
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+
+def write_rows(path, columns, rows, format=None, chunk_size=None):
+    """Write an iterable of row tuples to path; returns the number of rows written"""
+    with ExportWriter(path, columns, format, chunk_size) as writer:
+        writer.write_rows(rows)
+    return writer.rows_written
@@ -3,72 +3,168 @@ Hiring Signal Tracker
 Identifies companies actively hiring for SaaS security-related roles
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import time
 import re
-from datetime import datetime
-from fake_useragent import UserAgent
-from config import HIRING_KEYWORDS, JOB_BOARDS, TOP_COMPANIES_LIMIT
+import math
+import hashlib
+import threading
+from functools import partial
+from urllib.parse import urljoin
+from config import HIRING_KEYWORDS, JOB_BOARDS, TOP_COMPANIES_LIMIT, SIGNAL_WINDOW_DAYS, ROLE_RELEVANCE
+from collection_engine import CollectionEngine, CollectionStopped, CollectionTask, host_of
+from connectors import all_sources, enabled_sources, load_connector
+from http_client import create_session, random_user_agent
+from instrumentation import metrics
+from keyword_matcher import default_role_classifier
+from ranking import top_k
+from records import Company
+from scoring import signal_score, signal_strength
 import json
 
-ua = UserAgent()
+
+def hiring_unit_id(category, source, keyword):
+    """Stable ID of one (category, keyword, source) query for checkpoints and work queues"""
+    return f"hiring|{category}|{source}|{keyword}"
+
+OUTPUT_COLUMNS = [
+    'Rank', 'Company Name', 'Total Jobs', 'Categories', 'Signal Strength',
+    'Sample Roles', 'Data Sources', 'Last Updated'
+]
 
 class HiringTracker:
-    def __init__(self):
+    def __init__(self, parser=None, role_classifier=None, sources=None):
         self.companies = {}
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': ua.random
-        })
-    
-    def search_indeed(self, keyword, location="United States"):
-        """Search Indeed for job postings"""
-        companies = {}
-        try:
-            # Indeed search URL
-            url = f"https://www.indeed.com/jobs"
+        self.session = create_session(random_user_agent())
+        # Job boards to query: the enabled hiring connectors (SOURCES unless sources is given)
+        self.sources = enabled_sources('hiring', sources)
+        self.parser = parser or JOB_BOARDS['indeed']['parser']
+        self._parse_cards = None  # Resolved when the first Indeed page is parsed
+        # Drops postings whose title is unrelated to the keywords before they are stored or counted
+        self.role_classifier = role_classifier or (
+            default_role_classifier() if ROLE_RELEVANCE['enabled'] else None
+        )
+    
+    def search_indeed(self, keyword, location="United States", max_age_days=None):
+        """
+        Search Indeed for job postings
+        
+        Yields posting dicts as a stream, page by page, up to the configured
+        max_results. max_age_days limits results to postings published within
+        that many days (Indeed's fromage filter).
+        """
+        for page in self.iter_indeed_pages(keyword, location, max_age_days):
+            yield from page
+    
+    def iter_indeed_pages(self, keyword, location="United States", max_age_days=None, start_page=0):
+        """
+        Yield one list of postings per Indeed results page
+        
+        Stops at max_results, on an empty page, or when a page only repeats
+        postings already seen (Indeed keeps serving the last page past the end).
+        start_page skips pages an interrupted run already collected. A failed
+        request raises, so the caller knows the query did not finish.
+        """
+        url = JOB_BOARDS['indeed']['base_url']
+        page_size = JOB_BOARDS['indeed']['page_size']
+        start = start_page * page_size
+        max_results = JOB_BOARDS['indeed']['max_results'] - start
+        seen_ids = set()
+        
+        while len(seen_ids) < max_results:
             params = {
                 'q': keyword,
                 'l': location,
-                'start': 0
+                'start': start
             }
+            if max_age_days:
+                params['fromage'] = max_age_days
+            
+            try:
+                with metrics.timer('indeed.fetch'):
+                    response = self.session.get(url, params=params, timeout=10)
+                response.raise_for_status()
+                if response.status_code != 200:
+                    break
+                with metrics.timer('indeed.parse'):
+                    postings = self._parse_indeed_page(response.content, keyword, url)
+            except Exception as e:
+                print(f"Error searching Indeed for {keyword} (start={start}): {str(e)}")
+                raise
+            
+            # Repeats are judged by Indeed's own job URL, not the cross-source identity
+            new_postings = [posting for posting in postings if (posting['url'] or posting['id']) not in seen_ids]
+            if not new_postings:
+                break
             
-            # Note: In production, you'd want to paginate through results
-            # For this prototype, we'll simulate with a limited search
-            response = self.session.get(url, params=params, timeout=10)
+            new_postings = new_postings[:max_results - len(seen_ids)]
+            seen_ids.update(posting['url'] or posting['id'] for posting in new_postings)
+            yield new_postings
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
+            start += page_size
+    
+    def _parse_indeed_page(self, content, keyword, base_url):
+        """Extract postings from the job cards on one Indeed results page"""
+        postings = []
+        
+        for card in self.parse_cards(content):
+            company_name = card['company_name']
+            if company_name:
+                job_title = card['title']
+                location = card['location']
+                job_key = self._indeed_job_key(card['job_key'], card['href'])
                 
-                for card in job_cards[:50]:  # Limit for prototype
-                    try:
-                        company_elem = card.find('span', class_='companyName')
-                        if company_elem:
-                            company_name = company_elem.get_text(strip=True)
-                            if company_name:
-                                if company_name not in companies:
-                                    companies[company_name] = {
-                                        'count': 0,
-                                        'roles': [],
-                                        'keywords': []
-                                    }
-                                companies[company_name]['count'] += 1
-                                companies[company_name]['keywords'].append(keyword)
-                                
-                                # Extract job title
-                                title_elem = card.find('h2', class_='jobTitle')
-                                if title_elem:
-                                    job_title = title_elem.get_text(strip=True)
-                                    companies[company_name]['roles'].append(job_title)
-                    except Exception as e:
-                        continue
-        except Exception as e:
-            print(f"Error searching Indeed for {keyword}: {str(e)}")
+                postings.append({
+                    'id': self.posting_id('Indeed', job_key, company_name, job_title, location),
+                    'company_name': company_name,
+                    'title': job_title,
+                    'location': location,
+                    'url': self._indeed_job_url(job_key, card['href'], base_url),
+                    'keyword': keyword
+                })
         
-        return companies
+        return postings
+    
+    def parse_cards(self, content):
+        """Extract job cards with the configured parser backend, loading the Indeed connector on first use"""
+        if self._parse_cards is None:
+            self._parse_cards = load_connector('indeed').get_parser(self.parser)
+        return self._parse_cards(content)
+    
+    def posting_id(self, source, job_key, company_name, title, location):
+        """
+        Stable identity for a job posting across keywords and searches
+        
+        The board's own job key when it has one, so separate openings with
+        the same title and location stay separate; otherwise the posting's
+        fingerprint (see posting_key).
+        """
+        if job_key:
+            return f"{source.lower()}:{job_key}"
+        return self.posting_key(company_name, title, location)
+    
+    def posting_key(self, company_name, title, location):
+        """
+        Board-independent fingerprint of a job posting
+        
+        Boards use their own IDs and tracking URLs for the same role, so the
+        fingerprint is a hash of the normalized company, title and location.
+        It matches a posting across boards when aggregating.
+        """
+        parts = (' '.join(part.lower().split()) for part in (company_name, title, location or ''))
+        return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+    
+    def _indeed_job_key(self, job_key, href):
+        """Indeed's job key for a card, from its data attribute or its link's jk parameter"""
+        if not job_key and href:
+            match = re.search(r'[?&]jk=([0-9a-zA-Z]+)', href)
+            job_key = match.group(1) if match else None
+        return job_key or None
+    
+    def _indeed_job_url(self, job_key, href, base_url):
+        """Build a stable posting URL, preferring Indeed's job key over tracking links"""
+        if job_key:
+            return f"https://www.indeed.com/viewjob?jk={job_key}"
+        return urljoin(base_url, href) if href else ''
     
     def search_linkedin_simulated(self, keyword):
         """
@@ -79,7 +175,7 @@ class HiringTracker:
         - Selenium with proper rate limiting
         - Third-party services like Apify
         """
-        companies = {}
+        postings = []
         
         # Simulated data structure - in production, this would be actual scraping
         # For demonstration, we'll create a mock response
@@ -92,111 +188,242 @@ class HiringTracker:
         # driver.get(f"https://www.linkedin.com/jobs/search/?keywords={keyword}")
         # ... scraping logic ...
         
-        return companies
+        return postings
     
-    def collect_hiring_signals(self):
-        """Collect hiring signals from all sources"""
-        print("Collecting hiring signals...")
+    def hiring_tasks(self, sink, max_age_days=None, checkpoint=None, stopping=None):
+        """
+        Build one collection task per (keyword, source) query
         
-        all_companies = {}
+        Each task streams its postings into sink in page-sized batches and
+        returns how many of them sink accepted. Queries the checkpoint has
+        recorded as done are left out. Once the stopping event is set, each
+        task gives up before fetching its next page.
+        """
+        tasks = []
         
-        # Search across all keyword categories
         for category, keywords in HIRING_KEYWORDS.items():
-            print(f"Searching for {category} roles...")
-            
             for keyword in keywords:
-                # Search Indeed
-                indeed_companies = self.search_indeed(keyword)
-                for company, data in indeed_companies.items():
-                    if company not in all_companies:
-                        all_companies[company] = {
-                            'company_name': company,
-                            'total_jobs': 0,
-                            'categories': set(),
-                            'roles': [],
-                            'sources': []
-                        }
-                    all_companies[company]['total_jobs'] += data['count']
-                    all_companies[company]['categories'].add(category)
-                    all_companies[company]['roles'].extend(data['roles'])
-                    all_companies[company]['sources'].append('Indeed')
-                
-                # Add delay to respect rate limits
-                time.sleep(2)
-                
-                # LinkedIn (simulated)
-                linkedin_companies = self.search_linkedin_simulated(keyword)
-                for company, data in linkedin_companies.items():
-                    if company not in all_companies:
-                        all_companies[company] = {
-                            'company_name': company,
-                            'total_jobs': 0,
-                            'categories': set(),
-                            'roles': [],
-                            'sources': []
-                        }
-                    all_companies[company]['total_jobs'] += data['count']
-                    all_companies[company]['categories'].add(category)
-                    all_companies[company]['roles'].extend(data['roles'])
-                    all_companies[company]['sources'].append('LinkedIn')
-        
-        # Convert sets to lists for JSON serialization
-        for company in all_companies.values():
-            company['categories'] = list(company['categories'])
-            company['sources'] = list(set(company['sources']))
+                for source in self.sources:
+                    if checkpoint is not None and checkpoint.is_done(hiring_unit_id(category, source, keyword)):
+                        continue
+                    tasks.append(CollectionTask(
+                        host_of(JOB_BOARDS[source.lower()]['base_url']),
+                        self.collect_query, (category, keyword, source, sink, max_age_days, checkpoint, stopping),
+                        (category, source)
+                    ))
         
-        return all_companies
+        return tasks
     
-    def rank_companies(self, companies):
-        """Rank companies by hiring activity"""
-        # Convert to list and sort by total_jobs
-        company_list = list(companies.values())
-        company_list.sort(key=lambda x: x['total_jobs'], reverse=True)
+    def page_searcher(self, source, max_age_days=None, start_page=0):
+        """Return the page generator function for a job board"""
+        if source == 'Indeed':
+            return partial(self.iter_indeed_pages, max_age_days=max_age_days, start_page=start_page)
+        if source == 'LinkedIn':
+            return partial(self.iter_linkedin_pages, start_page=start_page)
+        raise ValueError(f"Unknown hiring source '{source}'")
+    
+    def collect_query(self, category, keyword, source, sink, max_age_days=None, checkpoint=None, stopping=None):
+        """
+        Run one (category, keyword, source) query, streaming its postings into sink
         
-        # Add ranking
-        for i, company in enumerate(company_list[:TOP_COMPANIES_LIMIT], 1):
-            company['rank'] = i
-            company['signal_strength'] = self._calculate_signal_strength(company)
+        With a checkpoint, every page is recorded once sink has taken it and
+        the query resumes after the last recorded page. The query is only
+        marked done if every page was fetched.
+        """
+        if checkpoint is None:
+            return self._stream_pages(
+                self.page_searcher(source, max_age_days), keyword, category, source, sink, stopping=stopping
+            )
+        
+        unit_id = hiring_unit_id(category, source, keyword)
+        pages = checkpoint.pages_done(unit_id)
+        
+        def on_page():
+            nonlocal pages
+            pages += 1
+            checkpoint.page_done(unit_id, pages)
+        
+        try:
+            accepted = self._stream_pages(
+                self.page_searcher(source, max_age_days, pages), keyword, category, source, sink, on_page, stopping
+            )
+        except Exception:
+            checkpoint.unit_failed(unit_id)
+            raise
+        checkpoint.unit_done(unit_id)
+        return accepted
+    
+    def iter_linkedin_pages(self, keyword, start_page=0):
+        """Page generator over the (simulated) LinkedIn search"""
+        if start_page == 0:
+            yield self.search_linkedin_simulated(keyword)
+    
+    def _stream_pages(self, search_pages, keyword, category, source, sink, on_page=None, stopping=None):
+        """
+        Tag each relevant posting with its category and source and hand each page to sink
         
-        return company_list[:TOP_COMPANIES_LIMIT]
+        on_page is called after each page has been handed over. Raises
+        CollectionStopped instead of fetching another page once stopping is set.
+        """
+        accepted = 0
+        source_key = source.lower()
+        with metrics.timer(f'search.{source_key}'):
+            for page in search_pages(keyword):
+                metrics.count(f'items.{source_key}', len(page))
+                if self.role_classifier is not None:
+                    relevant = [posting for posting in page if self.role_classifier.is_relevant(posting['title'])]
+                    metrics.count(f'items.{source_key}.irrelevant', len(page) - len(relevant))
+                    page = relevant
+                for posting in page:
+                    posting['category'] = category
+                    posting['source'] = source
+                if page:
+                    accepted += sink(page)
+                if on_page is not None:
+                    on_page()
+                if stopping is not None and stopping.is_set():
+                    raise CollectionStopped(f"{source} search for {keyword} stopped")
+        return accepted
     
-    def _calculate_signal_strength(self, company):
-        """Calculate signal strength based on multiple factors"""
-        score = 0
+    def collect_hiring_signals(self, engine=None, store=None, checkpoint=None):
+        """
+        Collect hiring signals from all sources
         
-        # More jobs = stronger signal
-        score += company['total_jobs'] * 10
+        Postings are consumed as a stream and merged page by page, so memory
+        does not grow with crawl depth. With a SignalStore, only postings newer
+        than the last run are fetched and stored, and companies are aggregated
+        from everything the store has seen within SIGNAL_WINDOW_DAYS. With a
+        RunCheckpoint (which needs the store), pages and queries an earlier,
+        interrupted attempt at this run already collected are skipped. The
+        high-water mark only moves once every query has succeeded.
+        """
+        if engine is None:
+            with CollectionEngine() as engine:
+                return self.collect_hiring_signals(engine, store, checkpoint)
+        
+        print("Collecting hiring signals...")
+        
+        run_started = checkpoint.run_started if checkpoint is not None else time.time()
+        max_age_days = None
+        all_companies = {}
         
-        # More categories = broader hiring
-        score += len(company['categories']) * 5
+        if store is not None:
+            last_run = store.get_high_water_mark('hiring')
+            if last_run:
+                max_age_days = max(1, math.ceil((run_started - last_run) / 86400))
+                print(f"Incremental run: postings from the last {max_age_days} day(s)")
+            
+            def sink(page):
+                return len(store.add_job_postings(page))
+        else:
+            merge_lock = threading.Lock()
+            seen_postings = set()
+            fingerprints = {}
+            
+            def sink(page):
+                with merge_lock:
+                    return sum(
+                        self._add_posting(all_companies, posting, seen_postings, fingerprints) for posting in page
+                    )
         
-        # Multiple sources = more reliable
-        score += len(company['sources']) * 3
+        # Queries across all keyword categories run concurrently; a failed one yields None
+        new_count = failed = 0
+        for _, accepted in engine.run(self.hiring_tasks(sink, max_age_days, checkpoint, engine.stopping)):
+            if accepted is None:
+                failed += 1
+            else:
+                new_count += accepted
         
-        if score >= 100:
-            return "Very High"
-        elif score >= 50:
-            return "High"
-        elif score >= 20:
-            return "Medium"
+        if store is None:
+            return all_companies
+        
+        print(f"Stored {new_count} new job postings")
+        if failed:
+            # The next run has to search the failed queries' window again
+            print(f"{failed} hiring queries failed: hiring high-water mark left unchanged")
+        elif self.sources == all_sources('hiring'):
+            store.set_high_water_mark('hiring', run_started)
         else:
-            return "Low"
+            # The skipped boards still need everything since the last full run
+            print("Partial source run: hiring high-water mark left unchanged")
+        window_start = run_started - SIGNAL_WINDOW_DAYS * 86400
+        return self.aggregate_postings(store.iter_job_postings(since=window_start))
+    
+    def aggregate_postings(self, postings):
+        """Aggregate job postings into per-company hiring records, counting each posting once"""
+        all_companies = {}
+        seen_postings = set()
+        fingerprints = {}
+        
+        for posting in postings:
+            self._add_posting(all_companies, posting, seen_postings, fingerprints)
+        
+        return all_companies
+    
+    def _add_posting(self, all_companies, posting, seen_postings, fingerprints):
+        """
+        Merge one posting sighting into its company record
+        
+        A posting already in seen_postings (found again via another keyword)
+        only adds its category and source. The same opening listed on several
+        boards is counted once: fingerprints maps each posting_key to the
+        number of distinct postings per board, and a posting only adds to
+        total_jobs when its board now has more of that fingerprint than any
+        other. Returns True if the posting was counted.
+        """
+        name = posting['company_name']
+        company = all_companies.get(name)
+        if company is None:
+            company = all_companies[name] = Company(name)
+        company.categories.add(posting['category'])
+        company.sources.add(posting['source'])
+        
+        if posting['id'] in seen_postings:
+            return False
+        seen_postings.add(posting['id'])
+        
+        per_board = fingerprints.setdefault(self.posting_key(name, posting['title'], posting['location']), {})
+        counted = max(per_board.values(), default=0)
+        per_board[posting['source']] = per_board.get(posting['source'], 0) + 1
+        if per_board[posting['source']] <= counted:
+            return False
+        
+        company.total_jobs += 1
+        if posting['title']:
+            company.add_role(posting['title'])
+        return True
+    
+    def rank_companies(self, companies):
+        """
+        Rank companies by hiring activity (accepts a dict keyed by name or any iterable of records)
+        
+        Only the top TOP_COMPANIES_LIMIT are kept while scanning; ties on job
+        count are broken by signal score, then by number of categories.
+        """
+        records = companies.values() if isinstance(companies, dict) else companies
+        ranked = top_k(records, TOP_COMPANIES_LIMIT, key=lambda company: (
+            company.total_jobs,
+            signal_score(company),
+            len(company.categories)
+        ))
+        
+        # Add ranking
+        for i, company in enumerate(ranked, 1):
+            company.rank = i
+            company.signal_strength = signal_strength(company)
+        
+        return ranked
     
-    def generate_output(self, ranked_companies):
-        """Generate CSV output"""
-        df_data = []
+    def iter_output_rows(self, ranked_companies, timestamp):
+        """Yield one output row per ranked company, in OUTPUT_COLUMNS order"""
         for company in ranked_companies:
-            df_data.append({
-                'Rank': company['rank'],
-                'Company Name': company['company_name'],
-                'Total Jobs': company['total_jobs'],
-                'Categories': ', '.join(company['categories']),
-                'Signal Strength': company['signal_strength'],
-                'Sample Roles': '; '.join(company['roles'][:5]),  # First 5 roles
-                'Data Sources': ', '.join(company['sources']),
-                'Last Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
-        
-        df = pd.DataFrame(df_data)
-        return df
-
+            yield (
+                company.rank,
+                company.company_name,
+                company.total_jobs,
+                ', '.join(company.categories),
+                company.signal_strength,
+                '; '.join(company.roles),  # Sampled roles
+                ', '.join(company.sources),
+                timestamp
+            )
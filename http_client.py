@@ -0,0 +1,383 @@
+"""
+HTTP Client
+Session factory shared by the hiring and conversation trackers
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import requests
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util import Retry, make_headers
+from collection_engine import host_of
+from instrumentation import metrics
+from rate_limiter import rate_limiter
+from config import COLLECTION_SETTINGS, HTTP_CACHE, HTTP_CLIENT, USER_AGENTS
+
+# gzip and deflate, plus br when a brotli decoder (brotli or brotlicffi) is installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+# Used when no User-Agent data can be loaded
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+
+class HTTPCache:
+    """
+    On-disk cache of GET responses with TTL and size-based eviction.
+    
+    Each entry is a body file plus a JSON metadata file holding the status,
+    headers and validators (ETag / Last-Modified) used for conditional requests.
+    The index is kept in least-recently-used order with a running byte total,
+    so a write only evicts when the cache is over max_bytes. Expired entries
+    are dropped when read and swept once when the cache is opened.
+    """
+    
+    def __init__(self, path=None, fresh_seconds=None, max_age_seconds=None, max_bytes=None):
+        self.path = path or HTTP_CACHE['path']
+        self.fresh_seconds = HTTP_CACHE['fresh_seconds'] if fresh_seconds is None else fresh_seconds
+        self.max_age_seconds = HTTP_CACHE['max_age_seconds'] if max_age_seconds is None else max_age_seconds
+        self.max_bytes = HTTP_CACHE['max_bytes'] if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._index = OrderedDict()  # key -> [size in bytes, last access time], least recently used first
+        self._total_bytes = 0
+        
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+        self._load_index()
+        self._evict()
+    
+    def _load_index(self):
+        entries = []
+        for filename in os.listdir(self.path):
+            if not filename.endswith('.json'):
+                continue
+            key = filename[:-len('.json')]
+            try:
+                size = os.path.getsize(self._body_path(key))
+                accessed = os.path.getmtime(self._meta_path(key))
+            except OSError:
+                continue
+            entries.append((accessed, key, size))
+        
+        for accessed, key, size in sorted(entries):
+            self._index[key] = [size, accessed]
+            self._total_bytes += size
+    
+    def _meta_path(self, key):
+        return os.path.join(self.path, key + '.json')
+    
+    def _body_path(self, key):
+        return os.path.join(self.path, key + '.body')
+    
+    def key_for(self, url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+    
+    def get(self, url):
+        """Return (metadata, body) for url, or None if not cached"""
+        key = self.key_for(url)
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                with open(self._meta_path(key)) as f:
+                    meta = json.load(f)
+                with open(self._body_path(key), 'rb') as f:
+                    body = f.read()
+            except (OSError, ValueError):
+                self._remove(key)
+                return None
+            
+            if time.time() - meta['stored_at'] > self.max_age_seconds:
+                self._remove(key)
+                return None
+            
+            now = time.time()
+            self._index[key][1] = now
+            self._index.move_to_end(key)
+            os.utime(self._meta_path(key), (now, now))
+        return meta, body
+    
+    def put(self, url, response, stored_at=None):
+        """Store a 200 response (or refresh an entry after a 304 revalidation)"""
+        key = self.key_for(url)
+        meta = {
+            'url': url,
+            'status_code': response.status_code,
+            'headers': dict(response.headers),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'stored_at': stored_at or time.time()
+        }
+        body = response.content
+        
+        with self._lock:
+            self._write(self._body_path(key), body, 'wb')
+            self._write(self._meta_path(key), json.dumps(meta), 'w')
+            replaced = self._index.pop(key, None)
+            if replaced is not None:
+                self._total_bytes -= replaced[0]
+            self._index[key] = [len(body), time.time()]
+            self._total_bytes += len(body)
+            self._shrink()
+    
+    def touch(self, url, meta):
+        """Mark a cached entry as freshly validated"""
+        key = self.key_for(url)
+        meta['stored_at'] = time.time()
+        with self._lock:
+            self._write(self._meta_path(key), json.dumps(meta), 'w')
+            if key in self._index:
+                self._index[key][1] = time.time()
+                self._index.move_to_end(key)
+    
+    def is_fresh(self, meta):
+        return time.time() - meta['stored_at'] < self.fresh_seconds
+    
+    def _write(self, path, data, mode):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, mode) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def _remove(self, key):
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[0]
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until under max_bytes"""
+        cutoff = time.time() - self.max_age_seconds
+        for key, (size, accessed) in list(self._index.items()):
+            if accessed < cutoff:
+                self._remove(key)
+        self._shrink()
+    
+    def _shrink(self):
+        """Drop least recently used entries until under max_bytes"""
+        while self._total_bytes > self.max_bytes and self._index:
+            self._remove(next(iter(self._index)))
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache():
+    """The HTTP cache shared by every tracker session, created on first use"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HTTPCache()
+        return _default_cache
+
+
+_user_agents = None
+_user_agents_lock = threading.Lock()
+
+
+def _load_user_agents():
+    """User-Agent strings from the local cache, sampling fake_useragent's data into it on first run"""
+    path = USER_AGENTS['cache_path']
+    try:
+        with open(path) as f:
+            agents = json.load(f)
+        if agents:
+            return agents
+    except (OSError, ValueError):
+        pass
+    
+    try:
+        from fake_useragent import UserAgent
+        ua = UserAgent()
+        agents = sorted({ua.random for _ in range(USER_AGENTS['size'])})
+    except Exception as e:
+        print(f"Error loading user agents: {str(e)}")
+        return [DEFAULT_USER_AGENT]
+    
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, 'w') as f:
+        json.dump(agents, f, indent=2)
+    return agents
+
+
+def random_user_agent():
+    """A browser User-Agent string, picked at random from the locally cached set"""
+    global _user_agents
+    with _user_agents_lock:
+        if _user_agents is None:
+            _user_agents = _load_user_agents()
+    return random.choice(_user_agents)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        metrics.count('http.connections.opened')
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        metrics.count('http.connections.opened')
+        return super()._new_conn()
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with keep-alive pools that count every connection they open.
+    
+    Requests served over a kept-alive connection open none, so
+    http.requests - http.connections.opened is the number of reuses.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool
+        }
+
+
+def retry_policy():
+    """Retries with exponential backoff for connection errors and HTTP_CLIENT['retry_statuses']"""
+    return Retry(
+        total=HTTP_CLIENT['retries'],
+        backoff_factor=HTTP_CLIENT['backoff_factor'],
+        status_forcelist=HTTP_CLIENT['retry_statuses'],
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False  # The final response is returned for the caller to check
+    )
+
+
+def mount_adapters(session):
+    """
+    Give session one pooled adapter per configured host plus a default one
+    
+    Each pool holds as many connections as the collection engine runs
+    threads for its host, so no connection is discarded after use.
+    """
+    default = PooledAdapter(
+        pool_connections=HTTP_CLIENT['pool_connections'],
+        pool_maxsize=COLLECTION_SETTINGS['default_host_concurrency'],
+        max_retries=retry_policy()
+    )
+    session.mount('http://', default)
+    session.mount('https://', default)
+    
+    for host, concurrency in COLLECTION_SETTINGS['host_concurrency'].items():
+        adapter = PooledAdapter(pool_connections=1, pool_maxsize=max(1, concurrency), max_retries=retry_policy())
+        session.mount(f'http://{host}/', adapter)
+        session.mount(f'https://{host}/', adapter)
+
+
+def wire_bytes(response):
+    """Bytes received for response's body before decompression"""
+    tell = getattr(getattr(response, 'raw', None), 'tell', None)
+    return tell() if tell is not None else len(response.content)
+
+
+class RateLimitedSession(requests.Session):
+    """requests.Session that spends a rate-limit token for the target host before every request"""
+    
+    def __init__(self, limiter=None):
+        super().__init__()
+        self.limiter = limiter or rate_limiter
+    
+    def request(self, method, url, *args, **kwargs):
+        host = host_of(url)
+        metrics.count('http.rate_limit_wait_seconds', self.limiter.acquire(host))
+        with metrics.timer('http.request'):
+            response = super().request(method, url, *args, **kwargs)
+        metrics.count('http.requests')
+        metrics.count(f'http.requests.{host}')
+        metrics.count('http.bytes', len(response.content))
+        metrics.count('http.wire_bytes', wire_bytes(response))
+        retries = getattr(getattr(response, 'raw', None), 'retries', None)
+        if retries is not None and retries.history:
+            metrics.count('http.retries', len(retries.history))
+        return response
+
+
+class CachedSession(RateLimitedSession):
+    """
+    Rate-limited session backed by an HTTPCache.
+    
+    Fresh entries are served without touching the network (or the rate
+    limiter); stale ones are revalidated with If-None-Match /
+    If-Modified-Since so an unchanged page costs a 304 instead of a download.
+    """
+    
+    def __init__(self, limiter=None, cache=None):
+        super().__init__(limiter)
+        self.cache = cache
+    
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        if self.cache is None or method.upper() != 'GET':
+            return super().request(method, url, params=params, headers=headers, **kwargs)
+        
+        full_url = requests.Request('GET', url, params=params).prepare().url
+        cached = self.cache.get(full_url)
+        
+        if cached is not None:
+            meta, body = cached
+            if self.cache.is_fresh(meta):
+                metrics.count('http.cache.fresh')
+                return self._cached_response(full_url, meta, body)
+            headers = dict(headers or {})
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        
+        response = super().request(method, url, params=params, headers=headers, **kwargs)
+        
+        if response.status_code == 304 and cached is not None:
+            metrics.count('http.cache.not_modified')
+            self.cache.touch(full_url, meta)
+            return self._cached_response(full_url, meta, body)
+        if response.status_code == 200:
+            self.cache.put(full_url, response)
+        return response
+    
+    def _cached_response(self, url, meta, body):
+        response = requests.Response()
+        response.status_code = meta['status_code']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response._content = body
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+
+def create_session(user_agent=None, limiter=None, cache=None):
+    """
+    Create a rate-limited, cached session for tracker requests
+    
+    Sessions use the shared on-disk cache unless another one is passed.
+    Connections are pooled per host and kept alive, retryable failures are
+    retried with backoff, and compressed responses are accepted.
+    """
+    session = CachedSession(limiter, cache if cache is not None else default_cache())
+    mount_adapters(session)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    if user_agent:
+        session.headers.update({
+            'User-Agent': user_agent
+        })
+    return session
@@ -0,0 +1,175 @@
+"""
+Instrumentation
+Timers, counters and latency histograms shared by every tracker, written out
+as a JSON run report
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def current_rss_mb():
+    """Resident set size of this process right now, in MB (None where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 1)
+
+
+class LatencyHistogram:
+    """Count, total, min, max and fixed-bucket distribution of durations"""
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)  # Last bucket: slower than every bound
+    
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+    
+    def merge(self, other):
+        """Fold in another histogram, e.g. one recorded by a worker process"""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.buckets = [mine + theirs for mine, theirs in zip(self.buckets, other.buckets)]
+    
+    def to_dict(self):
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            'count': self.count,
+            'total_seconds': round(self.total, 4),
+            'mean_ms': round(self.total / self.count * 1000, 2) if self.count else None,
+            'min_ms': round(self.min * 1000, 2) if self.min is not None else None,
+            'max_ms': round(self.max * 1000, 2) if self.max is not None else None,
+            'buckets': {label: n for label, n in zip(labels, self.buckets) if n}
+        }
+
+
+class Metrics:
+    """
+    Thread-safe registry of named timers and counters for one run.
+    
+    Timer names are dotted ("search.indeed", "http.request"); each one
+    accumulates a latency histogram. Counters are plain sums ("http.bytes",
+    "items.reddit"). Stages additionally record how much the RSS grew while
+    they ran and the process's peak RSS so far, which is cumulative over the
+    stages before them.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.timers = {}
+            self.counters = {}
+            self.stages = {}
+    
+    @contextmanager
+    def timer(self, name):
+        """Time the enclosed block into the histogram for name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+    
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self.timers.get(name)
+            if histogram is None:
+                histogram = self.timers[name] = LatencyHistogram()
+            histogram.observe(seconds)
+    
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+    
+    def merge(self, timers, counters):
+        """Fold in the timers and counters another process recorded (see snapshot)"""
+        with self._lock:
+            for name, other in timers.items():
+                histogram = self.timers.get(name)
+                if histogram is None:
+                    histogram = self.timers[name] = LatencyHistogram()
+                histogram.merge(other)
+            for name, value in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+    
+    def snapshot(self):
+        """Picklable copy of the timers and counters, for merge in another process"""
+        with self._lock:
+            return dict(self.timers), dict(self.counters)
+    
+    def record_stage(self, name, seconds, rss_start_mb=None):
+        """Record a finished stage; rss_start_mb is current_rss_mb() taken when it began"""
+        rss_end_mb = current_rss_mb()
+        rss_delta_mb = None
+        if rss_start_mb is not None and rss_end_mb is not None:
+            rss_delta_mb = round(rss_end_mb - rss_start_mb, 1)
+        with self._lock:
+            self.stages[name] = {
+                'seconds': round(seconds, 4),
+                'rss_delta_mb': rss_delta_mb,
+                'process_peak_rss_mb': peak_rss_mb()  # Cumulative: includes every earlier stage
+            }
+    
+    def report(self):
+        with self._lock:
+            return {
+                'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started)),
+                'elapsed_seconds': round(time.time() - self.started, 3),
+                'peak_rss_mb': peak_rss_mb(),
+                'stages': dict(self.stages),
+                'timers': {name: histogram.to_dict() for name, histogram in sorted(self.timers.items())},
+                'counters': dict(sorted(self.counters.items()))
+            }
+    
+    def write_report(self, path):
+        """Write the run report as JSON; returns path"""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+
+# Shared by every tracker, session and pipeline stage in the process
+metrics = Metrics()
@@ -0,0 +1,83 @@
+"""
+Job Card Parsers
+Pluggable backends that extract job cards from Indeed results pages
+"""
+
+from lxml import html as lxml_html
+
+# Class-token match that also works when the element carries other classes
+CARD_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' job_seen_beacon ')]"
+COMPANY_XPATH = ".//span[contains(concat(' ', normalize-space(@class), ' '), ' companyName ')]"
+TITLE_XPATH = ".//h2[contains(concat(' ', normalize-space(@class), ' '), ' jobTitle ')]"
+LOCATION_XPATH = ".//div[contains(concat(' ', normalize-space(@class), ' '), ' companyLocation ')]"
+
+
+def _card_from_soup(card):
+    company_elem = card.find('span', class_='companyName')
+    location_elem = card.find('div', class_='companyLocation')
+    title_elem = card.find('h2', class_='jobTitle')
+    link_elem = title_elem.find('a') if title_elem else None
+    return {
+        'company_name': company_elem.get_text(strip=True) if company_elem else '',
+        'title': title_elem.get_text(strip=True) if title_elem else '',
+        'location': location_elem.get_text(strip=True) if location_elem else '',
+        'job_key': link_elem.get('data-jk') if link_elem is not None else None,
+        'href': link_elem.get('href', '') if link_elem is not None else ''
+    }
+
+
+def parse_cards_soup(content):
+    """Reference backend: full html.parser tree, then find_all over it"""
+    from bs4 import BeautifulSoup  # Only the BeautifulSoup backends need it
+    soup = BeautifulSoup(content, 'html.parser')
+    return [_card_from_soup(card) for card in soup.find_all('div', class_='job_seen_beacon')]
+
+
+def parse_cards_strainer(content):
+    """BeautifulSoup on lxml, materializing only the job-card subtrees"""
+    from bs4 import BeautifulSoup, SoupStrainer
+    strainer = SoupStrainer('div', class_='job_seen_beacon')
+    soup = BeautifulSoup(content, 'lxml', parse_only=strainer)
+    return [_card_from_soup(card) for card in soup.find_all('div', class_='job_seen_beacon')]
+
+
+def _text(elem):
+    # Same result as BeautifulSoup's get_text(strip=True)
+    return ''.join(part.strip() for part in elem.itertext())
+
+
+def parse_cards_lxml(content):
+    """Fast path: lxml tree with XPath lookups, no BeautifulSoup objects"""
+    if not content or not content.strip():
+        return []
+    tree = lxml_html.fromstring(content)
+    
+    cards = []
+    for card in tree.xpath(CARD_XPATH):
+        company_elems = card.xpath(COMPANY_XPATH)
+        location_elems = card.xpath(LOCATION_XPATH)
+        title_elems = card.xpath(TITLE_XPATH)
+        link_elems = title_elems[0].xpath('.//a') if title_elems else []
+        link_elem = link_elems[0] if link_elems else None
+        cards.append({
+            'company_name': _text(company_elems[0]) if company_elems else '',
+            'title': _text(title_elems[0]) if title_elems else '',
+            'location': _text(location_elems[0]) if location_elems else '',
+            'job_key': link_elem.get('data-jk') if link_elem is not None else None,
+            'href': link_elem.get('href', '') if link_elem is not None else ''
+        })
+    return cards
+
+
+PARSERS = {
+    'soup': parse_cards_soup,
+    'strainer': parse_cards_strainer,
+    'lxml': parse_cards_lxml
+}
+
+
+def get_parser(name):
+    """Return the card parser registered under name"""
+    if name not in PARSERS:
+        raise ValueError(f"Unknown job card parser: {name} (expected one of {', '.join(PARSERS)})")
+    return PARSERS[name]
@@ -0,0 +1,148 @@
+"""
+Keyword Matcher
+Tags text with every configured keyword and topic it mentions in a single scan,
+and classifies job titles as relevant to the hiring keywords
+"""
+
+import re
+import threading
+from functools import lru_cache
+from config import CONVERSATION_TOPICS, HIRING_KEYWORDS, ROLE_RELEVANCE
+
+
+def _trie_pattern(node):
+    """Regex for a keyword trie; at each position it matches the longest keyword starting there"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # A keyword ends here, but a longer one may continue; greedy keeps the longest
+        pattern = f"(?:{pattern})?" if len(branches) == 1 else pattern + '?'
+    return pattern
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher for many keywords at once.
+    
+    The keywords are compiled into one prefix-factored regex, so a text is
+    scanned once regardless of how many keywords there are. The regex
+    reports the longest keyword at each position; shorter keywords inside
+    it ("SaaS Security" in "SaaS Security Posture Management") are implied
+    from a table built up front, so every mention is tagged.
+    """
+    
+    def __init__(self, topics):
+        """topics maps a topic name to its keywords"""
+        self.keyword_topics = {}  # lowercased keyword -> topics it belongs to
+        for topic, keywords in topics.items():
+            for keyword in keywords:
+                self.keyword_topics.setdefault(keyword.lower(), set()).add(topic)
+        
+        trie = {}
+        for keyword in self.keyword_topics:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+        
+        # Zero-width lookahead so overlapping mentions are all found. ASCII-only case folding:
+        # with Unicode folding "s" also matches "ſ" (long s), which lower() does not map back
+        self.pattern = re.compile(f"(?=({_trie_pattern(trie)}))", re.IGNORECASE | re.ASCII) if trie else None
+        self.implied = {
+            keyword: {other for other in self.keyword_topics if other in keyword}
+            for keyword in self.keyword_topics
+        }
+    
+    def covers(self, keywords):
+        """True if every keyword is one this matcher knows"""
+        return all(keyword.lower() in self.keyword_topics for keyword in keywords)
+    
+    def match(self, *texts):
+        """Return the set of lowercased keywords mentioned in any of texts"""
+        found = set()
+        if self.pattern is None:
+            return found
+        
+        for text in texts:
+            if not text:
+                continue
+            for longest in {m.group(1).lower() for m in self.pattern.finditer(text)}:
+                found |= self.implied.get(longest, ())
+        return found
+    
+    def topics(self, *texts):
+        """Return the set of topics whose keywords are mentioned in any of texts"""
+        topics = set()
+        for keyword in self.match(*texts):
+            topics |= self.keyword_topics[keyword]
+        return topics
+
+
+_default_matcher = None
+_default_matcher_lock = threading.Lock()
+
+
+def default_matcher():
+    """Matcher over every CONVERSATION_TOPICS and HIRING_KEYWORDS keyword, compiled on first use"""
+    global _default_matcher
+    with _default_matcher_lock:
+        if _default_matcher is None:
+            topics = {}
+            for config_topics in (CONVERSATION_TOPICS, HIRING_KEYWORDS):
+                for topic, keywords in config_topics.items():
+                    topics.setdefault(topic, []).extend(keywords)
+            _default_matcher = KeywordMatcher(topics)
+        return _default_matcher
+
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+class RoleClassifier:
+    """
+    Decides whether a job title is relevant to the tracked hiring keywords.
+    
+    A title is relevant when it contains every word of at least one keyword,
+    in any order ("Security Engineer, SaaS Platform" matches "SaaS security
+    engineer" words {saas, security}). Keyword word sets are built once and
+    verdicts for repeated titles come from an LRU cache.
+    """
+    
+    def __init__(self, topics, cache_size=None):
+        """topics maps a topic name to its keywords"""
+        self.keyword_words = {}  # keyword word set -> topics
+        for topic, keywords in topics.items():
+            for keyword in keywords:
+                words = frozenset(_WORD.findall(keyword.lower()))
+                if words:
+                    self.keyword_words.setdefault(words, set()).add(topic)
+        
+        # Check small word sets first; they are the likeliest to match
+        self._word_sets = sorted(self.keyword_words, key=len)
+        self.topics = lru_cache(maxsize=cache_size or ROLE_RELEVANCE['cache_size'])(self._topics)
+    
+    def _topics(self, title):
+        words = set(_WORD.findall(title.lower()))
+        return frozenset(
+            topic
+            for word_set in self._word_sets if word_set <= words
+            for topic in self.keyword_words[word_set]
+        )
+    
+    def is_relevant(self, title):
+        return bool(title) and bool(self.topics(title))
+
+
+_default_role_classifier = None
+
+
+def default_role_classifier():
+    """Role classifier over HIRING_KEYWORDS, built on first use"""
+    global _default_role_classifier
+    with _default_matcher_lock:
+        if _default_role_classifier is None:
+            _default_role_classifier = RoleClassifier(HIRING_KEYWORDS)
+        return _default_role_classifier
@@ -3,13 +3,13 @@ Main orchestration script for SaaS Security GTM Tracker
 Runs weekly data collection and generates output files
 """
 
+import argparse
 import os
 import sys
 from datetime import datetime
-from hiring_tracker import HiringTracker
-from conversation_tracker import ConversationTracker
-from data_processor import DataProcessor
-from config import OUTPUT_DIR
+from pipeline import SignalPipeline
+from connectors import CONNECTORS
+from config import OUTPUT_DIR, SOURCES
 
 def ensure_output_dir():
     """Create output directory if it doesn't exist"""
@@ -17,8 +17,20 @@ def ensure_output_dir():
         os.makedirs(OUTPUT_DIR)
         print(f"Created output directory: {OUTPUT_DIR}")
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SaaS Security GTM Signal Tracker")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Collect with this many worker processes (sharded crawl); default from SHARDING")
+    parser.add_argument('--sources', nargs='+', choices=list(CONNECTORS), default=None,
+                        help=f"Collect only from these sources (default: {' '.join(SOURCES)})")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue an interrupted run, skipping the queries it already collected")
+    return parser.parse_args(argv)
+
 def main():
     """Main execution function"""
+    args = parse_args()
+    
     print("=" * 60)
     print("SaaS Security GTM Signal Tracker")
     print(f"Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -28,64 +40,28 @@ def main():
     # Ensure output directory exists
     ensure_output_dir()
     
-    # Initialize components
-    hiring_tracker = HiringTracker()
-    conversation_tracker = ConversationTracker()
-    data_processor = DataProcessor()
-    
-    # 1. Collect Hiring Signals
-    print("\n[1/2] Collecting Hiring Signals...")
-    print("-" * 60)
-    companies = hiring_tracker.collect_hiring_signals()
-    
-    # Process and deduplicate
-    company_list = list(companies.values())
-    company_list = data_processor.deduplicate_companies(company_list)
-    
-    # Enrich data
-    for company in company_list:
-        data_processor.enrich_company_data(company)
-    
-    # Rank companies
-    ranked_companies = hiring_tracker.rank_companies(companies)
-    
-    # Generate output
-    hiring_df = hiring_tracker.generate_output(ranked_companies)
-    hiring_output_path = os.path.join(OUTPUT_DIR, "hiring_signals.csv")
-    hiring_df.to_csv(hiring_output_path, index=False)
-    print(f"\n✓ Hiring signals saved to: {hiring_output_path}")
-    print(f"  Total companies identified: {len(ranked_companies)}")
-    
-    # 2. Collect Conversation Signals
-    print("\n[2/2] Collecting Conversation Signals...")
-    print("-" * 60)
-    people, publishers = conversation_tracker.collect_conversation_signals()
-    
-    # Rank people and publishers
-    ranked_people = conversation_tracker.rank_people(people)
-    ranked_publishers = conversation_tracker.rank_publishers(publishers)
-    
-    # Generate outputs
-    people_df = conversation_tracker.generate_people_output(ranked_people)
-    people_output_path = os.path.join(OUTPUT_DIR, "conversation_signals_people.csv")
-    people_df.to_csv(people_output_path, index=False)
-    print(f"\n✓ People signals saved to: {people_output_path}")
-    print(f"  Total people identified: {len(ranked_people)}")
+    pipeline = SignalPipeline(workers=args.workers, resume=args.resume, sources=args.sources)
+    outputs = pipeline.run()
     
-    publishers_df = conversation_tracker.generate_publishers_output(ranked_publishers)
-    publishers_output_path = os.path.join(OUTPUT_DIR, "conversation_signals_publishers.csv")
-    publishers_df.to_csv(publishers_output_path, index=False)
-    print(f"\n✓ Publisher signals saved to: {publishers_output_path}")
-    print(f"  Total publishers identified: {len(ranked_publishers)}")
+    print(f"\n✓ Hiring signals saved to: {outputs['hiring']}")
+    print(f"  Total companies identified: {len(pipeline.companies)}")
+    print(f"\n✓ People signals saved to: {outputs['people']}")
+    print(f"  Total people identified: {len(pipeline.people)}")
+    print(f"\n✓ Publisher signals saved to: {outputs['publishers']}")
+    print(f"  Total publishers identified: {len(pipeline.publishers)}")
     
     # Summary
     print("\n" + "=" * 60)
     print("Data Collection Complete!")
     print("=" * 60)
     print(f"\nOutput Files:")
-    print(f"  1. {hiring_output_path}")
-    print(f"  2. {people_output_path}")
-    print(f"  3. {publishers_output_path}")
+    print(f"  1. {outputs['hiring']}")
+    print(f"  2. {outputs['people']}")
+    print(f"  3. {outputs['publishers']}")
+    print(f"  4. {outputs['report']} (run report)")
+    print(f"\nStage Timings:")
+    for stage, seconds in pipeline.timings.items():
+        print(f"  {stage:<8} {seconds:.2f}s")
     print(f"\nNext Steps:")
     print(f"  - Review the CSV files for actionable GTM signals")
     print(f"  - Schedule weekly runs (cron job or GitHub Actions)")
@@ -96,10 +72,10 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print("\n\nProcess interrupted by user.")
+        print("\n\nProcess interrupted by user. Run with --resume to continue where it stopped.")
         sys.exit(1)
     except Exception as e:
-        print(f"\n\nError: {str(e)}")
+        print(f"\n\nError: {str(e)}. Run with --resume to continue where it stopped.")
         import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -0,0 +1,156 @@
+"""
+Signal Pipeline
+Runs collect → dedupe → enrich → rank → export over one owned dataset
+"""
+
+import os
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from hiring_tracker import HiringTracker, OUTPUT_COLUMNS
+from conversation_tracker import ConversationTracker, PEOPLE_OUTPUT_COLUMNS, PUBLISHER_OUTPUT_COLUMNS
+from data_processor import DataProcessor
+from collection_engine import CollectionEngine
+from signal_store import SignalStore
+from sharded_crawl import ShardedCrawl
+from run_checkpoint import RunCheckpoint
+from export_writer import export_path, write_rows
+from instrumentation import current_rss_mb, metrics
+from config import EXPORT_SETTINGS, OUTPUT_DIR, RUN_REPORT_FILE, SHARDING, SIGNAL_STORE_PATH
+
+
+class SignalPipeline:
+    """
+    Weekly signal pipeline.
+    
+    The pipeline owns the company, people and publisher records from the
+    moment they are collected: each stage updates them in place or replaces
+    them with its result, so no stage keeps a stale copy around and ranking
+    always sees the deduplicated, enriched records.
+    """
+    
+    STAGES = ['collect', 'dedupe', 'enrich', 'rank', 'export']
+    
+    def __init__(self, hiring_tracker=None, conversation_tracker=None, data_processor=None,
+                 store=None, output_dir=OUTPUT_DIR, export_format=None, workers=None, resume=False,
+                 sources=None):
+        # Source names to collect from (see connectors.py); defaults to SOURCES
+        self.sources = sources
+        self.hiring_tracker = hiring_tracker or HiringTracker(sources=sources)
+        self.conversation_tracker = conversation_tracker or ConversationTracker(sources=sources)
+        self.data_processor = data_processor or DataProcessor()
+        # Raw items persist between runs; each run only fetches the weekly delta
+        self.store = store if store is not None else SignalStore(SIGNAL_STORE_PATH)
+        self.output_dir = output_dir
+        self.export_format = export_format or EXPORT_SETTINGS['format']
+        self.workers = workers or SHARDING['workers']
+        # Continue an interrupted run from its checkpoint instead of starting over
+        self.resume = resume
+        
+        self.companies = None
+        self.people = None
+        self.publishers = None
+        self.outputs = {}
+        self.timings = {}  # stage name -> seconds
+    
+    @contextmanager
+    def stage(self, name):
+        """Time a pipeline stage and record it, with its memory growth, in the run report"""
+        rss_start_mb = current_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.perf_counter() - start
+            metrics.record_stage(name, self.timings[name], rss_start_mb)
+            print(f"  [{name}] {self.timings[name]:.2f}s")
+    
+    def run(self):
+        """Run every stage in order; returns the output file paths, including the run report"""
+        metrics.reset()
+        for name in self.STAGES:
+            with self.stage(name):
+                getattr(self, name)()
+        self.outputs['report'] = metrics.write_report(os.path.join(self.output_dir, RUN_REPORT_FILE))
+        return self.outputs
+    
+    def collect(self):
+        """
+        Query all sources concurrently through one shared engine, or across worker processes
+        
+        Progress is checkpointed in the store as units finish; the checkpoint
+        is cleared once collection completes without a failed unit.
+        """
+        checkpoint = RunCheckpoint(self.store, self.resume) if self.store is not None else None
+        if checkpoint is not None and checkpoint.resumed:
+            started = datetime.fromtimestamp(checkpoint.run_started).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"Resuming run started {started}: {checkpoint.completed()} unit(s) already collected")
+        
+        if self.workers > 1:
+            self.companies, self.people, self.publishers = ShardedCrawl(self.store, self.workers, sources=self.sources).run(
+                self.hiring_tracker, self.conversation_tracker, checkpoint
+            )
+        else:
+            # Both trackers share one engine, so all sources are queried concurrently
+            # within their per-host limits and the run takes as long as the slowest host
+            executor = ThreadPoolExecutor(max_workers=2)
+            with CollectionEngine() as engine:
+                try:
+                    hiring_future = executor.submit(
+                        self.hiring_tracker.collect_hiring_signals, engine, self.store, checkpoint
+                    )
+                    conversation_future = executor.submit(
+                        self.conversation_tracker.collect_conversation_signals, engine, self.store, checkpoint
+                    )
+                    self.companies = hiring_future.result()
+                    self.people, self.publishers = conversation_future.result()
+                except BaseException:
+                    # Ctrl-C or a tracker error: cancel the remaining queries instead of draining them
+                    engine.stop()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+            executor.shutdown()
+        
+        if checkpoint is not None:
+            if checkpoint.failed:
+                # Keep the progress so the failed units can be retried
+                print(f"{len(checkpoint.failed)} unit(s) failed: `python main.py --resume` retries them")
+            else:
+                checkpoint.finish()
+    
+    def dedupe(self):
+        """Merge company name variants into one record per entity"""
+        metrics.count('dedupe.companies', len(self.companies))
+        self.companies = self.data_processor.deduplicate_companies(self.companies.values())
+        self.data_processor.save_entity_cache()
+    
+    def enrich(self):
+        metrics.count('enrich.companies', len(self.companies))
+        self.data_processor.enrich_companies(self.companies)
+    
+    def rank(self):
+        metrics.count('rank.records', len(self.companies) + len(self.people) + len(self.publishers))
+        self.companies = self.hiring_tracker.rank_companies(self.companies)
+        self.people = self.conversation_tracker.rank_people(self.people)
+        self.publishers = self.conversation_tracker.rank_publishers(self.publishers)
+    
+    def export(self):
+        """Stream each ranked dataset to its output file in chunks"""
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+        
+        # One timestamp for the whole run
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        outputs = [
+            ('hiring', "hiring_signals", OUTPUT_COLUMNS,
+             self.hiring_tracker.iter_output_rows(self.companies, timestamp)),
+            ('people', "conversation_signals_people", PEOPLE_OUTPUT_COLUMNS,
+             self.conversation_tracker.iter_people_rows(self.people, timestamp)),
+            ('publishers', "conversation_signals_publishers", PUBLISHER_OUTPUT_COLUMNS,
+             self.conversation_tracker.iter_publisher_rows(self.publishers, timestamp))
+        ]
+        for name, filename, columns, rows in outputs:
+            path = export_path(self.output_dir, filename, self.export_format)
+            metrics.count(f'export.rows.{name}', write_rows(path, columns, rows, self.export_format))
+            self.outputs[name] = path
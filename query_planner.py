@@ -0,0 +1,98 @@
+"""
+Query Planner
+Packs keyword searches into the fewest OR'd queries each social source's
+query limits allow, and attributes the results back to keywords locally
+"""
+
+import hashlib
+import re
+from config import QUERY_PLANNER
+from keyword_matcher import KeywordMatcher
+
+OR = ' OR '
+
+
+def _quote(term):
+    return f'"{term}"'
+
+
+def search_terms(keywords):
+    """
+    Keywords that have to be sent to find results for all of keywords
+    
+    A phrase search for "SaaS Security" already returns everything that
+    mentions "SaaS Security Posture Management", so a keyword containing
+    another keyword as whole words is left out of the query.
+    """
+    unique = list({keyword.lower(): keyword for keyword in keywords}.values())
+    lowered = [keyword.lower() for keyword in unique]
+    return [
+        keyword for keyword, low in zip(unique, lowered)
+        if not any(other != low and re.search(rf'\b{re.escape(other)}\b', low) for other in lowered)
+    ]
+
+
+class QueryBatch:
+    """
+    One batched search: the terms OR'd into its query and every keyword
+    its results are attributed to.
+    
+    A result is attributed to each keyword it mentions; a batch of a single
+    keyword attributes every result to it, as an unbatched search would.
+    """
+    
+    def __init__(self, source, terms, keywords):
+        self.source = source
+        self.terms = list(terms)
+        self.keywords = list(keywords)
+        self.query = OR.join(_quote(term) for term in self.terms) if len(self.terms) > 1 else self.terms[0]
+        self.unit_id = f"posts|{source}|{hashlib.sha1(self.query.encode('utf-8')).hexdigest()[:12]}"
+        self._matcher = KeywordMatcher({None: self.keywords}) if len(self.keywords) > 1 else None
+        self._keywords_by_lower = {keyword.lower(): keyword for keyword in self.keywords}
+    
+    def attribute(self, *texts):
+        """Keywords of this batch the result texts mention"""
+        if self._matcher is None:
+            return list(self.keywords)
+        return [
+            self._keywords_by_lower[keyword] for keyword in sorted(self._matcher.match(*texts))
+            if keyword in self._keywords_by_lower
+        ]
+
+
+def plan_queries(source, keywords, max_length=None, max_terms=None):
+    """
+    Split keywords into as few QueryBatches as the source's limits allow
+    
+    Terms are packed in order while the OR'd query stays within max_length
+    characters and max_terms terms. Each keyword left out of the query is
+    attributed through the batch holding the term that covers it. With
+    the planner disabled every keyword gets a batch of its own.
+    """
+    if not QUERY_PLANNER['enabled']:
+        return [QueryBatch(source, [keyword], [keyword]) for keyword in dict.fromkeys(keywords)]
+    
+    max_length = max_length or QUERY_PLANNER['max_query_length'][source]
+    max_terms = max_terms or len(keywords)
+    
+    term_groups = []
+    length = 0
+    for term in search_terms(keywords):
+        cost = len(_quote(term))
+        if term_groups and len(term_groups[-1]) < max_terms and length + len(OR) + cost <= max_length:
+            term_groups[-1].append(term)
+            length += len(OR) + cost
+        else:
+            term_groups.append([term])
+            length = cost
+    
+    # Every keyword rides with the first batch whose query finds it
+    group_keywords = [[] for _ in term_groups]
+    for keyword in {keyword.lower(): keyword for keyword in keywords}.values():
+        low = keyword.lower()
+        for terms, attributed in zip(term_groups, group_keywords):
+            if any(re.search(rf'\b{re.escape(term.lower())}\b', low) for term in terms):
+                attributed.append(keyword)
+                break
+    
+    return [QueryBatch(source, terms, attributed) for terms, attributed in zip(term_groups, group_keywords)]
@@ -0,0 +1,51 @@
+"""
+Ranking
+Bounded-heap top-K selection for companies, people and publishers
+"""
+
+import heapq
+import itertools
+
+
+class TopK:
+    """
+    Keeps the K best records seen so far in a bounded min-heap.
+    
+    Records can be pushed one at a time as they stream in, so ranking state
+    stays O(K) however many candidates there are. Ties on the key go to the
+    record pushed first, matching a stable descending sort.
+    """
+    
+    def __init__(self, k, key):
+        self.k = k
+        self.key = key
+        self._heap = []
+        self._counter = itertools.count()
+    
+    def push(self, record):
+        # -sequence makes earlier records compare larger among equal keys
+        item = (self.key(record), -next(self._counter), record)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+    
+    def extend(self, records):
+        for record in records:
+            self.push(record)
+    
+    def results(self):
+        """The kept records, best first"""
+        return [record for _, _, record in sorted(self._heap, key=lambda item: item[:2], reverse=True)]
+    
+    def __len__(self):
+        return len(self._heap)
+
+
+def top_k(records, k, key):
+    """Return the k records with the largest key, best first"""
+    if k <= 0:
+        return []
+    ranker = TopK(k, key)
+    ranker.extend(records)
+    return ranker.results()
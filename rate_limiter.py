@@ -0,0 +1,78 @@
+"""
+Rate Limiter
+Per-host token buckets that replace fixed sleeps between requests
+"""
+
+import threading
+import time
+from config import RATE_LIMITS
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    
+    Callers reserve a token up front and sleep only for as long as the bucket
+    needs to refill, so requests go out as fast as the budget allows.
+    """
+    
+    def __init__(self, requests, per_seconds, burst=None):
+        self.rate = requests / per_seconds  # tokens per second
+        self.capacity = burst if burst is not None else requests
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens=1):
+        """Take tokens from the bucket, blocking until they are available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Token buckets keyed by host, created on first use from RATE_LIMITS"""
+    
+    def __init__(self, limits=None):
+        self.limits = dict(RATE_LIMITS)
+        self.limits.update(limits or {})
+        self.workers = 1  # Budgets are currently split across this many processes
+        self._buckets = {}
+        self._lock = threading.Lock()
+    
+    def bucket(self, key):
+        with self._lock:
+            if key not in self._buckets:
+                limit = self.limits.get(key, self.limits['default'])
+                self._buckets[key] = TokenBucket(
+                    limit['requests'], limit['per_seconds'], limit.get('burst')
+                )
+            return self._buckets[key]
+    
+    def share(self, workers):
+        """Split every budget evenly across this many worker processes hitting the same hosts"""
+        with self._lock:
+            factor = workers / self.workers
+            for key, limit in self.limits.items():
+                self.limits[key] = dict(
+                    limit,
+                    requests=limit['requests'] / factor,
+                    burst=max(1, limit.get('burst', limit['requests']) / factor)
+                )
+            self.workers = workers
+            self._buckets = {}
+    
+    def acquire(self, key, tokens=1):
+        """Block until key's budget allows another request; returns seconds waited"""
+        return self.bucket(key).acquire(tokens)
+
+
+# Shared by every session so budgets hold across trackers
+rate_limiter = RateLimiter()
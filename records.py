@@ -0,0 +1,186 @@
+"""
+Record Types
+Compact slotted records for companies, people, posts and publishers, each
+keeping exact counts but only a bounded sample of roles, posts or articles
+"""
+
+import sys
+import zlib
+from bisect import bisect
+
+# Only as many samples as the CSV outputs show are kept per entity
+MAX_SAMPLE_ROLES = 5
+MAX_SAMPLE_POSTS = 1
+MAX_SAMPLE_ARTICLES = 1
+
+
+class SampleReservoir:
+    """
+    Exact count plus a bounded uniform sample of the distinct items added.
+    
+    Each item is ranked by a stable hash of its key and the `capacity` lowest
+    ranks are kept (bottom-k sampling), so memory stays bounded per entity and
+    the same data always yields the same samples, whatever order it arrives in.
+    """
+    
+    __slots__ = ('capacity', 'key', 'count', 'items', 'ranks')
+    
+    def __init__(self, capacity, key=None):
+        self.capacity = capacity
+        self.key = key
+        self.count = 0
+        self.items = []
+        self.ranks = []
+    
+    def add(self, item):
+        self.count += 1
+        self._offer(item)
+    
+    def _offer(self, item):
+        key = self.key(item) if self.key else item
+        rank = zlib.crc32(key.encode('utf-8'))
+        if len(self.ranks) == self.capacity and rank >= self.ranks[-1]:
+            return
+        if rank in self.ranks:
+            return  # Same key as a kept sample
+        
+        index = bisect(self.ranks, rank)
+        self.ranks.insert(index, rank)
+        self.items.insert(index, item)
+        if len(self.ranks) > self.capacity:
+            self.ranks.pop()
+            self.items.pop()
+    
+    def merge(self, other):
+        """Combine with another reservoir; the result is the sample of both sides' items"""
+        self.count += other.count
+        for item in other.items:
+            self._offer(item)
+    
+    def __iter__(self):
+        return iter(self.items)
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __getitem__(self, index):
+        return self.items[index]
+
+
+def _post_key(post):
+    return post.url or post.title or ''
+
+
+def _article_key(article):
+    return article.link or article.title or ''
+
+
+class Company:
+    """A company hiring for tracked roles"""
+    
+    __slots__ = (
+        'company_name', 'total_jobs', 'categories', 'sources', 'roles',
+        'rank', 'signal_strength', 'estimated_size', 'hiring_intensity'
+    )
+    
+    def __init__(self, company_name):
+        self.company_name = company_name
+        self.total_jobs = 0
+        self.categories = set()
+        self.sources = set()
+        self.roles = SampleReservoir(MAX_SAMPLE_ROLES)
+        self.rank = None
+        self.signal_strength = None
+        self.estimated_size = None
+        self.hiring_intensity = None
+    
+    def add_role(self, role):
+        self.roles.add(sys.intern(role))
+    
+    def merge(self, other):
+        """Absorb another record for the same company"""
+        self.total_jobs += other.total_jobs
+        self.categories.update(other.categories)
+        self.sources.update(other.sources)
+        self.roles.merge(other.roles)
+
+
+class Post:
+    """A social media post kept as a sample of a person's activity"""
+    
+    __slots__ = ('title', 'score', 'url', 'created')
+    
+    def __init__(self, title, score, url, created):
+        self.title = title
+        self.score = score
+        self.url = url
+        self.created = created
+
+
+class Person:
+    """An author discussing tracked topics"""
+    
+    __slots__ = ('username', 'platform', 'posts', 'topics', 'engagement', 'rank', 'influence_score')
+    
+    def __init__(self, username, platform):
+        self.username = username
+        self.platform = sys.intern(platform)
+        self.posts = SampleReservoir(MAX_SAMPLE_POSTS, key=_post_key)
+        self.topics = set()
+        self.engagement = 0
+        self.rank = None
+        self.influence_score = None
+    
+    @property
+    def post_count(self):
+        return self.posts.count
+    
+    def add_post(self, post, topic):
+        self.engagement += post.score
+        self.topics.add(sys.intern(topic))
+        self.posts.add(post)
+    
+    def merge(self, other):
+        """Absorb another record for the same author"""
+        self.engagement += other.engagement
+        self.topics.update(other.topics)
+        self.posts.merge(other.posts)
+
+
+class Article:
+    """A publisher article kept as a sample of its coverage"""
+    
+    __slots__ = ('title', 'link', 'published', 'summary')
+    
+    def __init__(self, title, link, published, summary):
+        self.title = title
+        self.link = link
+        self.published = published
+        self.summary = summary
+
+
+class Publisher:
+    """A cybersecurity publisher covering tracked topics"""
+    
+    __slots__ = ('publisher', 'url', 'articles', 'topics', 'rank', 'relevance_score')
+    
+    def __init__(self, publisher, url):
+        self.publisher = publisher
+        self.url = url
+        self.articles = SampleReservoir(MAX_SAMPLE_ARTICLES, key=_article_key)
+        self.topics = set()
+        self.rank = None
+        self.relevance_score = None
+    
+    @property
+    def article_count(self):
+        return self.articles.count
+    
+    def add_article(self, article, topic):
+        self.topics.add(sys.intern(topic))
+        self.articles.add(article)
+    
+    def merge(self, other):
+        """Absorb another record for the same publisher"""
+        self.topics.update(other.topics)
+        self.articles.merge(other.articles)
@@ -0,0 +1,78 @@
+"""
+Run Checkpoint
+Progress of an in-flight collection run, kept in the signal store so a run
+that dies partway can be resumed without repeating finished work
+"""
+
+import threading
+import time
+
+RUN_STARTED_KEY = 'run_started'
+
+
+class RunCheckpoint:
+    """
+    Completed collection units and pages of the current run.
+    
+    A unit is one (keyword, source) query or one publisher feed, identified
+    by the same unit IDs as the sharded crawl's work queue. Items are written
+    to the signal store as each page or unit finishes, so the store itself
+    holds the run's partial results; the checkpoint only records which work
+    is done. A unit is only marked done once it succeeded; failed units are
+    noted so the run's progress is kept for --resume to retry them. With
+    resume=True an unfinished earlier run is continued, keeping its start
+    time; otherwise any leftover progress is discarded.
+    """
+    
+    def __init__(self, store, resume=False):
+        self.store = store
+        self._lock = threading.Lock()
+        
+        run_started = store.get_high_water_mark(RUN_STARTED_KEY) if resume else None
+        self.resumed = run_started is not None
+        if run_started is None:
+            store.clear_checkpoints()
+            run_started = time.time()
+            store.set_high_water_mark(RUN_STARTED_KEY, run_started)
+        self.run_started = run_started
+        self._units = store.get_checkpoints()
+        self.failed = set()
+    
+    def completed(self):
+        """Number of units finished so far"""
+        with self._lock:
+            return sum(1 for _, done in self._units.values() if done)
+    
+    def is_done(self, unit_id):
+        with self._lock:
+            return self._units.get(unit_id, (0, False))[1]
+    
+    def pages_done(self, unit_id):
+        """Pages of unit_id already collected"""
+        with self._lock:
+            return self._units.get(unit_id, (0, False))[0]
+    
+    def page_done(self, unit_id, pages):
+        """Record that the first pages pages of unit_id are collected"""
+        with self._lock:
+            self._units[unit_id] = (pages, False)
+        self.store.set_checkpoint(unit_id, pages)
+    
+    def unit_done(self, unit_id):
+        with self._lock:
+            pages = self._units.get(unit_id, (0, False))[0]
+            self._units[unit_id] = (pages, True)
+        self.store.set_checkpoint(unit_id, pages, done=True)
+    
+    def unit_failed(self, unit_id):
+        """Record that unit_id did not finish; it stays pending for a resumed run"""
+        with self._lock:
+            self.failed.add(unit_id)
+    
+    def finish(self):
+        """The run completed: drop its progress so the next run starts fresh"""
+        self.store.clear_checkpoints()
+        self.store.clear_high_water_mark(RUN_STARTED_KEY)
+        with self._lock:
+            self._units = {}
+            self.failed = set()
@@ -0,0 +1,74 @@
+"""
+Scoring
+Signal scores and the buckets shown in the outputs, assigned per record
+"""
+
+# Companies and people live as records, so each bucket is a few comparisons
+# on the record itself. Copying them into a pandas frame for pd.cut and the
+# labels back costs several times more per row (benchmarks/bench_scoring.py).
+
+
+def signal_score(company):
+    """Numeric hiring signal score behind the signal strength bucket"""
+    score = 0
+
+    # More jobs = stronger signal
+    score += company.total_jobs * 10
+
+    # More categories = broader hiring
+    score += len(company.categories) * 5
+
+    # Multiple sources = more reliable
+    score += len(company.sources) * 3
+
+    return score
+
+
+def signal_strength(company):
+    """Calculate signal strength based on multiple factors"""
+    score = signal_score(company)
+
+    if score >= 100:
+        return "Very High"
+    elif score >= 50:
+        return "High"
+    elif score >= 20:
+        return "Medium"
+    else:
+        return "Low"
+
+
+def estimated_size(company):
+    """Company size estimate based on job count"""
+    if company.total_jobs >= 20:
+        return 'Large'
+    elif company.total_jobs >= 10:
+        return 'Medium'
+    else:
+        return 'Small'
+
+
+def hiring_intensity(company):
+    """Hiring intensity based on job count"""
+    if company.total_jobs >= 15:
+        return 'Very Active'
+    elif company.total_jobs >= 8:
+        return 'Active'
+    elif company.total_jobs >= 3:
+        return 'Moderate'
+    else:
+        return 'Low'
+
+
+def influence_score(person):
+    """Calculate influence score based on engagement"""
+    score = person.engagement
+
+    if score >= 1000:
+        return "Very High"
+    elif score >= 500:
+        return "High"
+    elif score >= 100:
+        return "Medium"
+    else:
+        return "Low"
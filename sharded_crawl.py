@@ -0,0 +1,365 @@
+"""
+Sharded Crawl
+Splits collection into (category, keyword, source) work units that a pool of
+worker processes - and workers on other machines sharing the work directory -
+drain from a SQLite work queue. Each worker writes its own shard store; the
+merge step folds the shards into the signal store and aggregates companies,
+people and publishers exactly as an in-process run does.
+
+The work directory is on a local disk by default: SQLite's WAL journal does
+not work over a network filesystem. To let other machines join, point
+SHARDING['work_dir'] at the shared directory and set SHARDING['journal_mode']
+to "DELETE" on every machine, then from each of them:
+    python sharded_crawl.py --work-dir /shared/shards --share 4
+"""
+
+import argparse
+import glob
+import math
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from config import (
+    HIRING_KEYWORDS, CYBERSECURITY_PUBLISHERS, JOB_BOARDS, SHARDING, SIGNAL_WINDOW_DAYS
+)
+from collection_engine import CollectionEngine, CollectionTask, host_of
+from connectors import all_sources, enabled_sources
+from conversation_tracker import (
+    ConversationTracker, POST_SOURCE_HOSTS, conversation_keywords, feed_unit_id, plan_post_queries
+)
+from hiring_tracker import HiringTracker, hiring_unit_id
+from instrumentation import metrics
+from query_planner import QueryBatch
+from rate_limiter import rate_limiter
+from signal_store import SignalStore
+from work_queue import WorkQueue
+
+QUEUE_FILE = 'queue.db'
+MERGE_BATCH_SIZE = 1000
+
+
+def plan_units(max_age_days=None, since=None, sources=None):
+    """Every collection work unit for one run over the enabled sources, as (unit_id, payload) pairs"""
+    units = []
+    for category, keywords in HIRING_KEYWORDS.items():
+        for keyword in keywords:
+            for source in enabled_sources('hiring', sources):
+                units.append((hiring_unit_id(category, source, keyword), {
+                    'kind': 'hiring', 'category': category, 'keyword': keyword,
+                    'source': source, 'max_age_days': max_age_days
+                }))
+    
+    if enabled_sources('feeds', sources):
+        for publisher in CYBERSECURITY_PUBLISHERS:
+            units.append((feed_unit_id(publisher['name']), {
+                'kind': 'feed', 'publisher': publisher['name'], 'since': since
+            }))
+    
+    for source in enabled_sources('posts', sources):
+        for batch in plan_post_queries(source):
+            units.append((batch.unit_id, {
+                'kind': 'posts', 'source': source, 'terms': batch.terms, 'keywords': batch.keywords, 'since': since
+            }))
+    
+    return units
+
+
+class ShardWorker:
+    """
+    Drains the work queue, writing everything it collects to its own shard store.
+    
+    Units are claimed in batches and run through a CollectionEngine, so each
+    worker keeps the usual per-host concurrency limits. A batch can take far
+    longer than one lease while its units wait for their host, so a heartbeat
+    thread renews the lease on every unit the worker holds, and each unit
+    checks it still holds its lease before it starts. share is the number
+    of workers hitting the same hosts at once; each worker's rate budgets
+    are divided by it so the fleet stays within the configured limits.
+    """
+    
+    def __init__(self, work_dir, worker_id=None, share=1):
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.queue = WorkQueue(
+            os.path.join(work_dir, QUEUE_FILE), SHARDING['lease_seconds'], SHARDING['max_attempts'],
+            SHARDING['journal_mode']
+        )
+        self.store = SignalStore(
+            os.path.join(work_dir, f"shard-{self.worker_id}.db"), journal_mode=SHARDING['journal_mode']
+        )
+        if share > 1:
+            rate_limiter.share(share)
+        
+        self.hiring_tracker = HiringTracker()
+        self.conversation_tracker = ConversationTracker()
+        self.publishers = {publisher['name']: publisher for publisher in CYBERSECURITY_PUBLISHERS}
+        self.all_keywords = conversation_keywords()
+        self._held = set()  # Unit IDs claimed and not yet completed or failed
+        self._held_lock = threading.Lock()
+    
+    def run(self):
+        """Process units until the queue has none left to hand out; returns how many were completed"""
+        completed = 0
+        with CollectionEngine() as engine, self.heartbeat():
+            while True:
+                claimed = self.queue.claim(self.worker_id, SHARDING['batch_size'])
+                if not claimed:
+                    return completed
+                with self._held_lock:
+                    self._held.update(unit_id for unit_id, _ in claimed)
+                tasks = [
+                    CollectionTask(self.unit_host(payload), self.run_leased_unit, (unit_id, payload), unit_id)
+                    for unit_id, payload in claimed
+                ]
+                # The engine reports a failed unit as None; it goes back on the queue
+                for task, result in engine.run(tasks):
+                    with self._held_lock:
+                        self._held.discard(task.context)
+                    if result is None:
+                        self.queue.fail(task.context, self.worker_id, "collection error")
+                    elif self.queue.complete(task.context, self.worker_id):
+                        completed += 1
+    
+    @contextmanager
+    def heartbeat(self):
+        """Renew the leases on held units every third of a lease until the block exits"""
+        stopped = threading.Event()
+        
+        def renew():
+            while not stopped.wait(SHARDING['lease_seconds'] / 3):
+                with self._held_lock:
+                    held = list(self._held)
+                try:
+                    self.queue.touch(held, self.worker_id)
+                except sqlite3.Error as e:
+                    print(f"Error renewing work unit leases: {str(e)}")
+        
+        thread = threading.Thread(target=renew, name=f"lease-heartbeat-{self.worker_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stopped.set()
+            thread.join()
+    
+    def run_leased_unit(self, unit_id, payload):
+        """Run a unit if this worker still holds its lease, renewing it as the unit starts"""
+        if not self.queue.touch([unit_id], self.worker_id):
+            raise RuntimeError(f"Lease on work unit {unit_id} was lost before it started")
+        return self.run_unit(payload)
+    
+    def unit_host(self, payload):
+        kind = payload['kind']
+        if kind == 'hiring':
+            return host_of(JOB_BOARDS[payload['source'].lower()]['base_url'])
+        if kind == 'feed':
+            return host_of(self.publishers[payload['publisher']]['rss'])
+        return POST_SOURCE_HOSTS[payload['source']]
+    
+    def run_unit(self, payload):
+        """Collect one unit into the shard store; returns how many items were stored"""
+        kind = payload['kind']
+        if kind == 'hiring':
+            return self.hiring_tracker.collect_query(
+                payload['category'], payload['keyword'], payload['source'],
+                lambda page: len(self.store.add_job_postings(page)), payload['max_age_days']
+            )
+        if kind == 'feed':
+            publisher = self.publishers[payload['publisher']]
+            entries = self.conversation_tracker.fetch_publisher_feed(publisher)
+            return len(self.store.add_articles(self.conversation_tracker.match_publisher_articles(
+                self.all_keywords, {publisher['name']: entries}, since=payload['since']
+            )))
+        if kind == 'posts':
+            search = self.conversation_tracker.post_searcher(payload['source'], payload['since'])
+            batch = QueryBatch(payload['source'], payload['terms'], payload['keywords'])
+            return len(self.store.add_posts(search(batch) or []))
+        raise ValueError(f"Unknown work unit kind '{kind}'")
+
+
+def run_worker(work_dir, share=1):
+    """Process-pool entry point: run one worker and hand its timers and counters back to the coordinator"""
+    metrics.reset()  # A pool process may run more than one worker
+    completed = ShardWorker(work_dir, share=share).run()
+    return completed, metrics.snapshot()
+
+
+def _batches(rows, size=MERGE_BATCH_SIZE):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+class ShardedCrawl:
+    """
+    Coordinator for a sharded collection run.
+    
+    Plans the work units, runs a local pool of workers over them, waits for
+    any units still leased to remote workers - taking over the ones whose
+    lease runs out - then merges every shard.
+    """
+    
+    def __init__(self, store, workers=None, work_dir=None, sources=None):
+        self.store = store
+        self.workers = workers or SHARDING['workers']
+        self.work_dir = work_dir or SHARDING['work_dir']
+        self.sources = sources
+        self.queue = WorkQueue(
+            os.path.join(self.work_dir, QUEUE_FILE), SHARDING['lease_seconds'], SHARDING['max_attempts'],
+            SHARDING['journal_mode']
+        )
+    
+    def shard_paths(self):
+        return sorted(glob.glob(os.path.join(self.work_dir, 'shard-*.db')))
+    
+    def plan(self, run_started):
+        """Queue a fresh set of work units, dropping any left over from an earlier crawl"""
+        self.queue.clear()
+        for path in self.shard_paths():
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+        
+        max_age_days = since = None
+        if self.store is not None:
+            last_hiring = self.store.get_high_water_mark('hiring')
+            if last_hiring:
+                max_age_days = max(1, math.ceil((run_started - last_hiring) / 86400))
+            since = self.store.get_high_water_mark('conversation')
+        
+        units = plan_units(max_age_days, since, self.sources)
+        self.queue.enqueue(units)
+        return len(units)
+    
+    def run(self, hiring_tracker, conversation_tracker, checkpoint=None):
+        """
+        Crawl every unit across the workers; returns (companies, people, publishers)
+        
+        When checkpoint resumes an interrupted run, the queue and shards it
+        left behind are kept: finished units are not planned again, and units
+        that failed or are still leased to its dead workers are handed out afresh.
+        """
+        run_started = checkpoint.run_started if checkpoint is not None else time.time()
+        if checkpoint is not None and checkpoint.resumed and self.queue.counts():
+            released = self.queue.release()
+            print(f"Resuming sharded crawl: {self.queue.remaining()} work units left ({released} released)")
+        else:
+            unit_count = self.plan(run_started)
+            print(f"Sharded crawl: {unit_count} work units across {self.workers} worker processes")
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(run_worker, self.work_dir, self.workers) for _ in range(self.workers)]
+            for future in futures:
+                _, (timers, counters) = future.result()
+                metrics.merge(timers, counters)
+        
+        self.drain()
+        
+        failed = self.queue.failed()
+        if failed:
+            print(f"Warning: {len(failed)} work unit(s) failed after {SHARDING['max_attempts']} attempts")
+        failed_kinds = Counter(payload['kind'] for _, payload in failed)
+        if checkpoint is not None:
+            for unit_id, _ in failed:
+                checkpoint.unit_failed(unit_id)
+        
+        return self.merge(hiring_tracker, conversation_tracker, run_started, failed_kinds)
+    
+    def drain(self):
+        """
+        Wait for units leased to workers on other machines
+        
+        A dead worker stops renewing its leases, so they run out and its
+        units are run here; the wait ends once every unit is done or failed.
+        """
+        while True:
+            self.queue.expire()
+            if not self.queue.remaining():
+                return
+            if self.queue.claimable():
+                ShardWorker(self.work_dir, share=self.workers).run()
+            else:
+                time.sleep(SHARDING['poll_seconds'])
+    
+    def merge(self, hiring_tracker, conversation_tracker, run_started, failed_kinds=None):
+        """
+        Fold every shard into the signal store and aggregate companies, people and publishers
+        
+        failed_kinds counts the units of each kind ('hiring', 'feed', 'posts')
+        that never succeeded; their high-water marks are left where they were
+        so the next run fetches what those units missed.
+        """
+        failed_kinds = failed_kinds or {}
+        shards = [SignalStore(path, journal_mode=SHARDING['journal_mode']) for path in self.shard_paths()]
+        
+        if self.store is None:
+            # No store to deduplicate through: aggregate straight from the shards
+            seen = set()
+            
+            def unique(rows):
+                for row in rows:
+                    key = (row['id'], row['keyword'])
+                    if key not in seen:
+                        seen.add(key)
+                        yield row
+            
+            return (
+                hiring_tracker.aggregate_postings(row for shard in shards for row in shard.iter_job_postings()),
+                conversation_tracker.aggregate_posts(unique(row for shard in shards for row in shard.iter_posts())),
+                conversation_tracker.aggregate_articles(
+                    unique(row for shard in shards for row in shard.iter_articles())
+                )
+            )
+        
+        new_postings = new_posts = new_articles = 0
+        for shard in shards:
+            for batch in _batches(shard.iter_job_postings()):
+                new_postings += len(self.store.add_job_postings(batch))
+            for batch in _batches(shard.iter_posts()):
+                new_posts += len(self.store.add_posts(batch))
+            for batch in _batches(shard.iter_articles()):
+                new_articles += len(self.store.add_articles(batch))
+        print(f"Merged {len(shards)} shard(s): {new_postings} new job postings, "
+              f"{new_posts} new posts, {new_articles} new articles")
+        
+        # A kind's mark only moves once every one of its sources has been collected, without failures
+        hiring_failed = failed_kinds.get('hiring', 0)
+        conversation_failed = failed_kinds.get('feed', 0) + failed_kinds.get('posts', 0)
+        if hiring_failed:
+            print(f"{hiring_failed} hiring work units failed: hiring high-water mark left unchanged")
+        elif enabled_sources('hiring', self.sources) == all_sources('hiring'):
+            self.store.set_high_water_mark('hiring', run_started)
+        if conversation_failed:
+            print(f"{conversation_failed} conversation work units failed: "
+                  f"conversation high-water mark left unchanged")
+        elif (enabled_sources('posts', self.sources) == all_sources('posts')
+                and enabled_sources('feeds', self.sources) == all_sources('feeds')):
+            self.store.set_high_water_mark('conversation', run_started)
+        window_start = run_started - SIGNAL_WINDOW_DAYS * 86400
+        return (
+            hiring_tracker.aggregate_postings(self.store.iter_job_postings(since=window_start)),
+            conversation_tracker.aggregate_posts(self.store.iter_posts(since=window_start)),
+            conversation_tracker.aggregate_articles(self.store.iter_articles(since=window_start))
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Join a sharded crawl as a worker")
+    parser.add_argument('--work-dir', default=SHARDING['work_dir'], help="Shared work directory of the crawl")
+    parser.add_argument('--share', type=int, default=1, help="Total workers hitting the same hosts (splits rate limits)")
+    args = parser.parse_args()
+    
+    completed = ShardWorker(args.work_dir, share=args.share).run()
+    print(f"Completed {completed} work unit(s)")
+
+
+if __name__ == "__main__":
+    main()
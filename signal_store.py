@@ -0,0 +1,206 @@
+"""
+Signal Store
+Persistent SQLite store for raw job postings, posts and articles between weekly runs
+"""
+
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_postings (
+    id TEXT PRIMARY KEY,
+    company_name TEXT,
+    title TEXT,
+    location TEXT,
+    url TEXT,
+    first_seen REAL
+);
+CREATE INDEX IF NOT EXISTS job_postings_first_seen ON job_postings (first_seen);
+
+CREATE TABLE IF NOT EXISTS job_posting_matches (
+    posting_id TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    category TEXT,
+    source TEXT NOT NULL,
+    first_seen REAL,
+    PRIMARY KEY (posting_id, keyword, source)
+);
+
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    author TEXT,
+    platform TEXT,
+    title TEXT,
+    score INTEGER,
+    url TEXT,
+    created TEXT,
+    first_seen REAL,
+    PRIMARY KEY (id, keyword)
+);
+CREATE INDEX IF NOT EXISTS posts_first_seen ON posts (first_seen);
+
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    publisher TEXT,
+    title TEXT,
+    link TEXT,
+    published TEXT,
+    summary TEXT,
+    first_seen REAL,
+    PRIMARY KEY (id, keyword)
+);
+CREATE INDEX IF NOT EXISTS articles_first_seen ON articles (first_seen);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value REAL
+);
+
+CREATE TABLE IF NOT EXISTS collection_checkpoints (
+    unit_id TEXT PRIMARY KEY,
+    pages INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+JOB_POSTING_COLUMNS = ['id', 'company_name', 'title', 'location', 'url']
+JOB_POSTING_MATCH_COLUMNS = ['posting_id', 'keyword', 'category', 'source']
+POST_COLUMNS = ['id', 'keyword', 'author', 'platform', 'title', 'score', 'url', 'created']
+ARTICLE_COLUMNS = ['id', 'keyword', 'publisher', 'title', 'link', 'published', 'summary']
+
+
+class SignalStore:
+    """
+    Raw collected items keyed by stable ID (board job key or posting
+    fingerprint, post URL, article link), the keywords they matched, and
+    per-collection high-water marks. Each job posting is stored once; every
+    (keyword, source) it was found through is recorded separately as a match.
+    
+    Every call opens its own short-lived connection, so the store can be
+    shared by trackers running on different threads.
+    """
+    
+    def __init__(self, path, journal_mode='WAL'):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with closing(self._connect()) as conn:
+            conn.execute(f"PRAGMA journal_mode={journal_mode}")
+            conn.executescript(SCHEMA)
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def get_high_water_mark(self, key):
+        """Return the timestamp recorded for key by the last run, or None"""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+    
+    def set_high_water_mark(self, key, value):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+    
+    def clear_high_water_mark(self, key):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM sync_state WHERE key = ?", (key,))
+    
+    def get_checkpoints(self):
+        """Progress of the current collection run: {unit_id: (pages, done)}"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT unit_id, pages, done FROM collection_checkpoints").fetchall()
+        return {row['unit_id']: (row['pages'], bool(row['done'])) for row in rows}
+    
+    def set_checkpoint(self, unit_id, pages, done=False):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO collection_checkpoints (unit_id, pages, done) VALUES (?, ?, ?) "
+                "ON CONFLICT(unit_id) DO UPDATE SET pages = excluded.pages, done = excluded.done",
+                (unit_id, pages, int(done))
+            )
+    
+    def clear_checkpoints(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM collection_checkpoints")
+    
+    def _add(self, table, columns, items):
+        """Insert items, skipping ones already stored; returns only the new ones"""
+        now = time.time()
+        sql = (
+            f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}, first_seen) "
+            f"VALUES ({', '.join('?' for _ in columns)}, ?)"
+        )
+        new_items = []
+        with closing(self._connect()) as conn, conn:
+            for item in items:
+                cursor = conn.execute(sql, [item.get(column) for column in columns] + [now])
+                if cursor.rowcount:
+                    new_items.append(item)
+        return new_items
+    
+    def _iter(self, table, since=None):
+        """Yield stored rows as dicts, optionally only those first seen after since"""
+        query = f"SELECT * FROM {table}"
+        params = ()
+        if since is not None:
+            query += " WHERE first_seen >= ?"
+            params = (since,)
+        query += " ORDER BY first_seen, rowid"
+        
+        with closing(self._connect()) as conn:
+            for row in conn.execute(query, params):
+                yield dict(row)
+    
+    def add_job_postings(self, postings):
+        """Store postings and the keyword/source they matched; returns postings not seen before"""
+        new_postings = self._add('job_postings', JOB_POSTING_COLUMNS, postings)
+        self._add('job_posting_matches', JOB_POSTING_MATCH_COLUMNS, [
+            {
+                'posting_id': posting['id'],
+                'keyword': posting['keyword'],
+                'category': posting['category'],
+                'source': posting['source']
+            }
+            for posting in postings
+        ])
+        return new_postings
+    
+    def add_posts(self, posts):
+        return self._add('posts', POST_COLUMNS, posts)
+    
+    def add_articles(self, articles):
+        return self._add('articles', ARTICLE_COLUMNS, articles)
+    
+    def iter_job_postings(self, since=None):
+        """Yield one row per (posting, match), grouped by posting, for postings first seen after since"""
+        query = (
+            "SELECT p.id, p.company_name, p.title, p.location, p.url, p.first_seen, "
+            "m.keyword, m.category, m.source "
+            "FROM job_postings p JOIN job_posting_matches m ON m.posting_id = p.id"
+        )
+        params = ()
+        if since is not None:
+            query += " WHERE p.first_seen >= ?"
+            params = (since,)
+        query += " ORDER BY p.first_seen, p.rowid"
+        
+        with closing(self._connect()) as conn:
+            for row in conn.execute(query, params):
+                yield dict(row)
+    
+    def iter_posts(self, since=None):
+        return self._iter('posts', since)
+    
+    def iter_articles(self, since=None):
+        return self._iter('articles', since)
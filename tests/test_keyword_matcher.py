@@ -0,0 +1,31 @@
+"""
+Keyword matcher tests: mentions are found case-insensitively, and Unicode
+look-alikes of keyword letters never crash a scan
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from keyword_matcher import KeywordMatcher, default_matcher
+
+
+def test_longest_match_implies_contained_keywords():
+    matcher = KeywordMatcher({'sspm': ['SSPM', 'SaaS Security Posture Management'], 'saas': ['SaaS Security']})
+    
+    assert matcher.match('New saas security posture management vendors') == {
+        'saas security posture management', 'saas security'
+    }
+    assert matcher.topics('SSPM roundup') == {'sspm'}
+
+
+def test_unicode_case_folds_do_not_crash():
+    # Long s and dotless i fold to ASCII letters under Unicode IGNORECASE, but lower() keeps them
+    matcher = default_matcher()
+    
+    assert matcher.match('SaaS ſecurity news') == set()
+    assert matcher.match('AI agent ſecurıty') == set()
+    assert matcher.topics('Kubernetes SaaS ſecurity') == set()
+    assert 'saas security' in matcher.match('SaaS ſecurity news, and SaaS Security too')
@@ -0,0 +1,25 @@
+"""
+Query planner tests: batched results are attributed back to the keywords
+they mention
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from query_planner import QueryBatch
+
+
+def test_attribute_keeps_configured_spelling():
+    batch = QueryBatch('Reddit', ['SaaS Security', 'SSPM'], ['SaaS Security', 'SSPM', 'SaaS security posture'])
+    
+    assert batch.attribute('What is saas security posture?') == ['SaaS Security', 'SaaS security posture']
+    assert batch.attribute('Nothing relevant') == []
+
+
+def test_attribute_ignores_unicode_look_alikes():
+    batch = QueryBatch('Reddit', ['SaaS Security', 'SSPM'], ['SaaS Security', 'SSPM'])
+    
+    assert batch.attribute('SaaS ſecurity breach', 'ſſpm') == []
@@ -0,0 +1,108 @@
+"""
+Run checkpoint tests: a unit that fails is not marked done, and a resumed
+run collects it and only then moves the high-water mark
+"""
+
+import os
+import sys
+
+import pytest
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import CYBERSECURITY_PUBLISHERS, HIRING_KEYWORDS
+from conversation_tracker import ConversationTracker, feed_unit_id
+from hiring_tracker import HiringTracker, hiring_unit_id
+from run_checkpoint import RunCheckpoint
+from signal_store import SignalStore
+
+with open(os.path.join(ROOT, 'benchmarks', 'fixtures', 'indeed_page_1.html'), 'rb') as f:
+    INDEED_PAGE = f.read()
+
+RSS_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>SaaS Security roundup</title><link>https://example.com/saas-security</link></item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    status_code = 200
+    
+    def __init__(self, content):
+        self.content = content
+    
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves content for every request, except to URLs in down"""
+    
+    def __init__(self, content, down=()):
+        self.content = content
+        self.down = set(down)
+    
+    def get(self, url, **kwargs):
+        if url in self.down:
+            raise requests.ConnectionError(f"{url} is down")
+        return FakeResponse(self.content)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Keeps the entity and user agent caches out of the repo
+    return SignalStore(str(tmp_path / 'signals.db'))
+
+
+def hiring_units(source):
+    return [
+        hiring_unit_id(category, source, keyword)
+        for category, keywords in HIRING_KEYWORDS.items() for keyword in keywords
+    ]
+
+
+def test_failed_hiring_queries_are_retried_on_resume(store):
+    tracker = HiringTracker(sources=['indeed', 'linkedin'])
+    tracker.session = FakeSession(INDEED_PAGE, down={'https://www.indeed.com/jobs'})
+    checkpoint = RunCheckpoint(store)
+    run_started = checkpoint.run_started
+    
+    tracker.collect_hiring_signals(store=store, checkpoint=checkpoint)
+    
+    assert not any(checkpoint.is_done(unit_id) for unit_id in hiring_units('Indeed'))
+    assert all(checkpoint.is_done(unit_id) for unit_id in hiring_units('LinkedIn'))
+    assert checkpoint.failed == set(hiring_units('Indeed'))
+    assert store.get_high_water_mark('hiring') is None
+    
+    tracker.session = FakeSession(INDEED_PAGE)
+    checkpoint = RunCheckpoint(store, resume=True)
+    assert checkpoint.resumed and checkpoint.run_started == run_started
+    
+    companies = tracker.collect_hiring_signals(store=store, checkpoint=checkpoint)
+    
+    assert all(checkpoint.is_done(unit_id) for unit_id in hiring_units('Indeed'))
+    assert not checkpoint.failed
+    assert companies
+    assert store.get_high_water_mark('hiring') == run_started
+
+
+def test_failed_feed_is_retried_on_resume(store):
+    tracker = ConversationTracker(sources=['rss'])
+    broken = CYBERSECURITY_PUBLISHERS[0]
+    tracker.session = FakeSession(RSS_FEED, down={broken['rss']})
+    
+    tracker.collect_conversation_signals(store=store, checkpoint=RunCheckpoint(store))
+    
+    checkpoint = RunCheckpoint(store, resume=True)
+    assert not checkpoint.is_done(feed_unit_id(broken['name']))
+    assert all(
+        checkpoint.is_done(feed_unit_id(publisher['name'])) for publisher in CYBERSECURITY_PUBLISHERS[1:]
+    )
+    
+    tracker.session = FakeSession(RSS_FEED)
+    tracker.collect_conversation_signals(store=store, checkpoint=checkpoint)
+    
+    assert checkpoint.is_done(feed_unit_id(broken['name']))
+    assert not checkpoint.failed
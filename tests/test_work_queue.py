@@ -0,0 +1,128 @@
+"""
+Work queue tests: leases are renewed by live workers, handed out again
+once they run out, and a worker that lost a unit cannot finish it
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import sharded_crawl
+import work_queue
+from work_queue import WorkQueue
+
+LEASE = 10
+
+
+class Clock:
+    """Stands in for the time module in work_queue"""
+    
+    def __init__(self):
+        self.now = 1_000_000.0
+    
+    def time(self):
+        return self.now
+    
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(work_queue, 'time', clock)
+    return clock
+
+
+def make_queue(tmp_path, units=2, max_attempts=3):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), lease_seconds=LEASE, max_attempts=max_attempts)
+    queue.enqueue((f"u{i}", {'kind': 'test'}) for i in range(units))
+    return queue
+
+
+def test_leased_units_are_not_handed_out_twice(tmp_path, clock):
+    queue = make_queue(tmp_path)
+    
+    assert [unit_id for unit_id, _ in queue.claim('a', 16)] == ['u0', 'u1']
+    clock.advance(LEASE - 1)
+    assert queue.claim('b', 16) == []
+    assert queue.claimable() == 0
+
+
+def test_touch_renews_the_lease(tmp_path, clock):
+    queue = make_queue(tmp_path)
+    queue.claim('a', 16)
+    
+    clock.advance(LEASE - 1)
+    assert queue.touch(['u0', 'u1'], 'a') == 2
+    clock.advance(LEASE - 1)
+    assert queue.claim('b', 16) == []
+    
+    assert queue.complete('u0', 'a')
+    assert queue.counts() == {'done': 1, 'claimed': 1}
+
+
+def test_expired_lease_moves_to_another_worker(tmp_path, clock):
+    queue = make_queue(tmp_path)
+    queue.claim('a', 16)
+    
+    clock.advance(LEASE + 1)
+    assert queue.claimable() == 2
+    assert [unit_id for unit_id, _ in queue.claim('b', 16)] == ['u0', 'u1']
+    
+    # a lost both units: it can neither renew, finish nor fail them
+    assert queue.touch(['u0', 'u1'], 'a') == 0
+    assert not queue.complete('u0', 'a')
+    assert not queue.fail('u1', 'a', "collection error")
+    assert queue.counts() == {'claimed': 2}
+    
+    assert queue.complete('u0', 'b')
+    assert queue.fail('u1', 'b', "collection error")
+    assert queue.counts() == {'done': 1, 'pending': 1}
+
+
+def test_unit_out_of_attempts_fails_and_stays_failed(tmp_path, clock):
+    queue = make_queue(tmp_path, units=1, max_attempts=2)
+    queue.claim('a', 16)
+    clock.advance(LEASE + 1)
+    queue.claim('b', 16)
+    clock.advance(LEASE + 1)
+    
+    assert queue.expire() == 1
+    assert not queue.complete('u0', 'a')
+    assert not queue.complete('u0', 'b')
+    assert queue.failed() == [('u0', {'kind': 'test'})]
+    assert queue.remaining() == 0
+
+
+def test_failed_attempts_are_retried_until_exhausted(tmp_path, clock):
+    queue = make_queue(tmp_path, units=1, max_attempts=2)
+    
+    queue.claim('a', 16)
+    assert queue.fail('u0', 'a', "collection error")
+    assert queue.counts() == {'pending': 1}
+    queue.claim('a', 16)
+    assert queue.fail('u0', 'a', "collection error")
+    assert queue.counts() == {'failed': 1}
+    
+    assert queue.release() == 1  # A resumed run gives failed units a fresh set of attempts
+    assert queue.claimable() == 1
+
+
+def test_coordinator_takes_over_a_dead_workers_units(tmp_path, clock, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Keeps the entity and user agent caches out of the repo
+    monkeypatch.setattr(sharded_crawl.ShardWorker, 'run_unit', lambda self, payload: 0)
+    crawl = sharded_crawl.ShardedCrawl(None, workers=2, work_dir=str(tmp_path / 'shards'))
+    unit_count = crawl.plan(clock.time())
+    leased = crawl.queue.claim('dead-remote', unit_count)
+    assert len(leased) == unit_count
+    
+    clock.advance(sharded_crawl.SHARDING['lease_seconds'] + 1)
+    crawl.drain()
+    
+    assert crawl.queue.counts() == {'done': unit_count}
+    assert not crawl.queue.complete(leased[0][0], 'dead-remote')
@@ -0,0 +1,186 @@
+"""
+Work Queue
+SQLite-backed queue of collection work units shared by worker processes, on
+one machine or several machines that share the queue file. The default WAL
+journal needs the file on a local disk; machines sharing it over a network
+filesystem must open it with journal_mode "DELETE"
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_units (
+    id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    claimed_at REAL,
+    finished_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS work_units_status ON work_units (status);
+"""
+
+PENDING = 'pending'
+CLAIMED = 'claimed'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class WorkQueue:
+    """
+    Durable queue of work units keyed by a stable unit ID.
+    
+    Workers claim units inside an immediate transaction, so no unit is
+    handed to two workers. A claim is a lease that its worker keeps renewing
+    with touch while it holds the unit: a unit whose worker died is handed
+    out again once lease_seconds have passed, up to max_attempts times.
+    complete and fail only apply while the worker still holds the lease, so
+    a worker that lost a unit cannot overwrite its new owner's state.
+    """
+    
+    def __init__(self, path, lease_seconds=900, max_attempts=3, journal_mode='WAL'):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with closing(self._connect()) as conn:
+            conn.execute(f"PRAGMA journal_mode={journal_mode}")
+            conn.executescript(SCHEMA)
+    
+    def _connect(self):
+        # Autocommit; transactions are opened explicitly where needed
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def enqueue(self, units):
+        """Add (unit_id, payload) pairs; units already queued are left as they are. Returns how many were added"""
+        added = 0
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for unit_id, payload in units:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO work_units (id, payload) VALUES (?, ?)",
+                    (unit_id, json.dumps(payload))
+                )
+                added += cursor.rowcount
+            conn.execute("COMMIT")
+        return added
+    
+    def claim(self, worker, limit=1):
+        """Lease up to limit available units to worker; returns a list of (unit_id, payload), empty when none is left"""
+        now = time.time()
+        expired = now - self.lease_seconds
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._fail_exhausted(conn, expired)
+            rows = conn.execute(
+                "SELECT id, payload FROM work_units "
+                "WHERE (status = ? OR (status = ? AND claimed_at < ?)) AND attempts < ? "
+                "ORDER BY rowid LIMIT ?",
+                (PENDING, CLAIMED, expired, self.max_attempts, limit)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE work_units SET status = ?, worker = ?, claimed_at = ?, attempts = attempts + 1 "
+                "WHERE id = ?",
+                [(CLAIMED, worker, now, row['id']) for row in rows]
+            )
+            conn.execute("COMMIT")
+        return [(row['id'], json.loads(row['payload'])) for row in rows]
+    
+    def _fail_exhausted(self, conn, expired):
+        # Leases that ran out on their last attempt will never be retried
+        return conn.execute(
+            "UPDATE work_units SET status = ?, error = 'lease expired' "
+            "WHERE status = ? AND claimed_at < ? AND attempts >= ?",
+            (FAILED, CLAIMED, expired, self.max_attempts)
+        ).rowcount
+    
+    def expire(self):
+        """Fail the leases that ran out on their last attempt; returns how many"""
+        with closing(self._connect()) as conn:
+            return self._fail_exhausted(conn, time.time() - self.lease_seconds)
+    
+    def claimable(self):
+        """Units a claim would hand out now: pending ones and expired leases with attempts left"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n FROM work_units "
+                "WHERE (status = ? OR (status = ? AND claimed_at < ?)) AND attempts < ?",
+                (PENDING, CLAIMED, time.time() - self.lease_seconds, self.max_attempts)
+            ).fetchone()
+        return row['n']
+    
+    def touch(self, unit_ids, worker):
+        """Renew worker's leases on unit_ids; returns how many it still holds"""
+        with closing(self._connect()) as conn:
+            cursor = conn.executemany(
+                "UPDATE work_units SET claimed_at = ? WHERE id = ? AND worker = ? AND status = ?",
+                [(time.time(), unit_id, worker, CLAIMED) for unit_id in unit_ids]
+            )
+        return cursor.rowcount
+    
+    def complete(self, unit_id, worker):
+        """Mark worker's unit done; returns False if worker no longer holds it"""
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE work_units SET status = ?, finished_at = ?, error = NULL "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (DONE, time.time(), unit_id, worker, CLAIMED)
+            )
+        return cursor.rowcount == 1
+    
+    def fail(self, unit_id, worker, error):
+        """
+        Record a failed attempt by worker; the unit is retried until it runs
+        out of attempts. Returns False if worker no longer holds it
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE work_units SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, "
+                "error = ?, worker = NULL WHERE id = ? AND worker = ? AND status = ?",
+                (self.max_attempts, PENDING, FAILED, str(error), unit_id, worker, CLAIMED)
+            )
+        return cursor.rowcount == 1
+    
+    def release(self):
+        """
+        Hand every leased or failed unit out again, e.g. when resuming after
+        the workers died; failed units get a fresh set of attempts. Returns how many
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE work_units SET status = ?, worker = NULL, "
+                "attempts = CASE WHEN status = ? THEN 0 ELSE attempts END WHERE status IN (?, ?)",
+                (PENDING, FAILED, CLAIMED, FAILED)
+            )
+        return cursor.rowcount
+    
+    def counts(self):
+        """Number of units per status"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM work_units GROUP BY status").fetchall()
+        return {row['status']: row['n'] for row in rows}
+    
+    def failed(self):
+        """(unit_id, payload) of every unit that ran out of attempts"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT id, payload FROM work_units WHERE status = ?", (FAILED,)).fetchall()
+        return [(row['id'], json.loads(row['payload'])) for row in rows]
+    
+    def remaining(self):
+        """Units still pending or leased out"""
+        counts = self.counts()
+        return counts.get(PENDING, 0) + counts.get(CLAIMED, 0)
+    
+    def clear(self):
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM work_units")